@@ -31,3 +31,4 @@ driver.diagnostics.store_grid(
     grid_data=driver.state.grid_data,
     metadata=driver.state.dycore_state.ps.metadata,
 )
+driver.diagnostics.cleanup()
@@ -45,7 +45,13 @@ def parse_args():
 
 
 args = parse_args()
-ds = xr.open_zarr(store=zarr.DirectoryStore(path=args.zarr_output), consolidated=False)
+ds = xr.open_zarr(
+    store=zarr.DirectoryStore(path=args.zarr_output),
+    consolidated=None,
+    chunks={},
+    decode_times=False,
+    mask_and_scale=False,
+)
 fig, ax = plt.subplots(1, 1, subplot_kw={"projection": ccrs.Robinson()})
 lat = ds["lat"].values * 180.0 / np.pi
 lon = ds["lon"].values * 180.0 / np.pi
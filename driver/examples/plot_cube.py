@@ -6,7 +6,13 @@ from cartopy import crs as ccrs
 from fv3viz import pcolormesh_cube
 
 
-ds = xr.open_zarr(store=zarr.DirectoryStore(path="output.zarr"), consolidated=False)
+ds = xr.open_zarr(
+    store=zarr.DirectoryStore(path="output.zarr"),
+    consolidated=None,
+    chunks={},
+    decode_times=False,
+    mask_and_scale=False,
+)
 fig, ax = plt.subplots(1, 1, subplot_kw={"projection": ccrs.Robinson()})
 lat = ds["lat"].values * 180.0 / np.pi
 lon = ds["lon"].values * 180.0 / np.pi
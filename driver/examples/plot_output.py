@@ -11,7 +11,13 @@ except ModuleNotFoundError:
     )
     raise
 
-ds = xr.open_zarr(store=zarr.DirectoryStore(path="output.zarr"), consolidated=False)
+ds = xr.open_zarr(
+    store=zarr.DirectoryStore(path="output.zarr"),
+    consolidated=None,
+    chunks={},
+    decode_times=False,
+    mask_and_scale=False,
+)
 
 
 fig, ax = plt.subplots(2, 3, figsize=(12, 8))
@@ -109,23 +109,48 @@ def gather_fortran_data_at_klevel(path: str, cn: int, var: str, klevel: int):
         var: variable name to be extracted
         klevel: index number in the k-axis to be read
     """
-    ts_size = len(
-        xr.open_dataset(path + "/atmos_custom_fine_inst.tile1.nc", decode_times=False)[
-            "time"
-        ]
-    )
+    with xr.open_dataset(
+        path + "/atmos_custom_fine_inst.tile1.nc",
+        decode_times=False,
+        decode_coords=False,
+    ) as f:
+        ts_size = len(f["time"])
     total_tiles = 6
     fortran_data = np.zeros((ts_size, total_tiles, cn, cn))
     for rank in range(total_tiles):
         with xr.open_dataset(
             path + "/atmos_custom_fine_inst.tile" + str(rank + 1) + ".nc",
             decode_times=False,
+            decode_coords=False,
         ) as f:
-            for t in range(ts_size):
-                fortran_data[t, rank, :, :] = f[var][t, klevel, :, :].T
+            # read all timesteps of the level at once
+            block = f[var][:, klevel, :, :].values
+        fortran_data[:, rank, :, :] = np.transpose(block, (0, 2, 1))
     return fortran_data
 
 
+def select_zlevel(dims, t: int, zlevel: int, size: int):
+    """Build an index selecting a single timestep and z-level from a zarr array
+    Args:
+        dims: dimension names of the array, as stored in its
+            _ARRAY_DIMENSIONS attribute
+        t: index of the timestep to select
+        zlevel: index of the z-level to select
+        size: number of points to select along the horizontal dimensions
+    """
+    index = []
+    for i, dim in enumerate(dims):
+        if dim == "time":
+            index.append(t)
+        elif dim == "z":
+            index.append(zlevel)
+        elif i in (2, 3):
+            index.append(slice(0, size))
+        else:
+            index.append(slice(None))
+    return tuple(index)
+
+
 if __name__ == "__main__":
     args = parse_args()
     if args.fortran_data_path is not None:
@@ -134,44 +159,68 @@ if __name__ == "__main__":
                 "You must specify the variable name (fortran_var) \
                     to be subtracted in Fortran data."
             )
-        fortran = gather_fortran_data_at_klevel(
-            args.fortran_data_path, args.size, args.fortran_var, args.zlevel
-        )
     if args.fortran_var is not None and args.fortran_data_path is None:
         raise ValueError(
             "You must specify the path (fortran_data_path) to Fortran data."
         )
-    ds = xr.open_zarr(
-        store=zarr.DirectoryStore(path=args.zarr_output), consolidated=False
-    )
-    python_lat = ds["lat"].values * 180.0 / np.pi
-    python_lon = ds["lon"].values * 180.0 / np.pi
     if args.diff_init:
         if args.fortran_data_path is not None:
             raise ValueError(
                 "You cannot plot the difference from Fortran \
                     when plotting the python difference from the first time step."
             )
-        python_init = (
-            ds[args.variable][:, :, 0 : args.size, 0 : args.size, :]
-            .isel(time=0, z=args.zlevel)
-            .values
+    # hold the zarr arrays directly, so metadata is only read once
+    # rather than on every timestep
+    store = zarr.LRUStoreCache(
+        zarr.DirectoryStore(path=args.zarr_output), max_size=2**30
+    )
+    try:
+        root = zarr.open_consolidated(store=store, mode="r")
+    except KeyError:
+        # stores written without consolidated metadata
+        root = zarr.open_group(store=store, mode="r")
+    variable = root[args.variable]
+    variable_dims = variable.attrs["_ARRAY_DIMENSIONS"]
+    # stores written by newer versions of pace contain lat/lon in degrees
+    if "lat_deg" in root and "lon_deg" in root:
+        python_lat = root["lat_deg"][:]
+        python_lon = root["lon_deg"][:]
+    else:
+        python_lat = root["lat"][:]
+        python_lon = root["lon"][:]
+        np.multiply(python_lat, 180.0 / np.pi, out=python_lat)
+        np.multiply(python_lon, 180.0 / np.pi, out=python_lon)
+    if args.fortran_data_path is not None:
+        fortran = gather_fortran_data_at_klevel(
+            args.fortran_data_path, args.size, args.fortran_var, args.zlevel
         )
+    if args.diff_init:
+        python_init = variable[select_zlevel(variable_dims, 0, args.zlevel, args.size)]
+    # frames are only written to file, so use a non-interactive backend and
+    # re-use one figure and colorbar rather than building them every timestep
+    plt.switch_backend("Agg")
+    fig, ax = plt.subplots(1, 1, subplot_kw={"projection": ccrs.Robinson()})
+    colorbar = None
+    title = args.experiment.replace("_", " ")
+    if args.zarr_output == "/model_output/output.zarr":
+        save_path = "/work/"
+    else:
+        save_path = ""
     for t in range(args.start, args.stop):
-        python = (
-            ds[args.variable][:, :, 0 : args.size, 0 : args.size, :]
-            .isel(time=t, z=args.zlevel)
-            .values
-        )
+        python = variable[select_zlevel(variable_dims, t, args.zlevel, args.size)]
         if args.fortran_data_path is not None:
             plotted_data = python - fortran[t, :]
         elif args.diff_init:
             plotted_data = python - python_init
         else:
             plotted_data = python
-        fig, ax = plt.subplots(1, 1, subplot_kw={"projection": ccrs.Robinson()})
+        # single precision is enough for plotting, and a contiguous array
+        # avoids copies when matplotlib flattens each tile's mesh data
+        plotted_data = np.ascontiguousarray(plotted_data, dtype=np.float32)
+        ax.clear()
         if args.force_symmetric_colorbar:
-            abs_max = np.abs(plotted_data).max()
+            # avoids allocating a temporary for np.abs(plotted_data)
+            abs_max = float(max(-plotted_data.min(), plotted_data.max()))
             h = pcolormesh_cube(
                 python_lat,
                 python_lon,
@@ -197,8 +246,12 @@ if __name__ == "__main__":
                 plotted_data,
                 ax=ax,
             )
-        fig.colorbar(h, ax=ax, location="bottom", label=f"{args.variable}")
-        title = args.experiment.replace("_", " ")
+        if colorbar is None:
+            colorbar = fig.colorbar(
+                h, ax=ax, location="bottom", label=f"{args.variable}"
+            )
+        else:
+            colorbar.update_normal(h)
         fig.suptitle(f"{title}: {args.variable}, z={args.zlevel}, timestep={t+1}")
         ax.annotate(
             "Generated on " + datetime.now().strftime("%m/%d/%y %H:%M:%S"),
@@ -208,13 +261,10 @@ if __name__ == "__main__":
             va="center",
             fontsize=8,
         )
-        plt.tight_layout()
-        if args.zarr_output == "/model_output/output.zarr":
-            save_path = "/work/"
-        else:
-            save_path = ""
-        plt.savefig(
+        if t == args.start:
+            fig.tight_layout()
+        fig.savefig(
             f"{save_path}{args.experiment}_{args.variable}_time_{t:02d}.png",
             dpi=150,
         )
-        plt.close()
+    plt.close(fig)
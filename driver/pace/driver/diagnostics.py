@@ -1,5 +1,6 @@
 import abc
 import dataclasses
+import math
 from datetime import datetime, timedelta
 from typing import List, Optional, Union
 
@@ -30,6 +31,10 @@ class Diagnostics(abc.ABC):
     ):
         ...
 
+    @abc.abstractmethod
+    def cleanup(self):
+        ...
+
 
 @dataclasses.dataclass(frozen=True)
 class DiagnosticsConfig:
@@ -42,12 +47,20 @@ class DiagnosticsConfig:
         output_initial_state: flag to determine if the first output should be the
             initial state of the model before timestepping
         names: diagnostics to save
+        z_chunk_size: chunk size of the vertical dimension in the output,
+            by default each column is stored in one chunk, use 1 to read
+            single levels (e.g. for plotting) without reading the whole column
+        dtype: data type of the output, by default the data type of each
+            diagnostic, a lower precision type such as "float16" reduces the
+            output size when it is only used for visualization
     """
 
     path: Optional[str] = None
     output_frequency: int = 1
     output_initial_state: bool = False
     names: List[str] = dataclasses.field(default_factory=list)
+    z_chunk_size: Optional[int] = None
+    dtype: Optional[str] = None
 
     def __post_init__(self):
         if len(self.names) > 0 and self.path is None:
@@ -70,7 +83,12 @@ class DiagnosticsConfig:
             return NullDiagnostics()
         else:
             return ZarrDiagnostics(
-                path=self.path, names=self.names, partitioner=partitioner, comm=comm
+                path=self.path,
+                names=self.names,
+                partitioner=partitioner,
+                comm=comm,
+                z_chunk_size=self.z_chunk_size,
+                dtype=self.dtype,
             )
 
 
@@ -83,6 +101,8 @@ class ZarrDiagnostics(Diagnostics):
         names: List[str],
         partitioner: pace.util.CubedSpherePartitioner,
         comm,
+        z_chunk_size: Optional[int] = None,
+        dtype: Optional[str] = None,
     ):
         if zarr_storage is None:
             raise ModuleNotFoundError("zarr must be installed to use this class")
@@ -90,7 +110,11 @@ class ZarrDiagnostics(Diagnostics):
             self.names = names
             store = zarr_storage.DirectoryStore(path=path)
             self.monitor = pace.util.ZarrMonitor(
-                store=store, partitioner=partitioner, mpi_comm=comm
+                store=store,
+                partitioner=partitioner,
+                mpi_comm=comm,
+                z_chunk_size=z_chunk_size,
+                dtype=dtype,
             )
 
     def store(self, time: Union[datetime, timedelta], state: DriverState):
@@ -118,8 +142,19 @@ class ZarrDiagnostics(Diagnostics):
                 units="rad",
             )
             zarr_grid[name] = grid_quantity
+            # also store degrees, so plotting does not need to convert
+            zarr_grid[f"{name}_deg"] = pace.util.Quantity(
+                grid_quantity.data * (180.0 / math.pi),
+                dims=grid_quantity.dims,
+                origin=grid_quantity.origin,
+                extent=grid_quantity.extent,
+                units="degrees",
+            )
         self.monitor.store_constant(zarr_grid)
 
+    def cleanup(self):
+        self.monitor.consolidate_metadata()
+
 
 class NullDiagnostics(Diagnostics):
     """Diagnostics that do nothing."""
@@ -131,3 +166,6 @@ class NullDiagnostics(Diagnostics):
         self, grid_data: pace.util.grid.GridData, metadata: QuantityMetadata
     ):
         pass
+
+    def cleanup(self):
+        pass
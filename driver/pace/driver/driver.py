@@ -1,3 +1,4 @@
+import copy
 import dataclasses
 import functools
 import logging
@@ -29,6 +30,63 @@ from .performance import PerformanceConfig
 
 logger = logging.getLogger(__name__)
 
+_STRICT_DACITE_CONFIG = dacite.Config(strict=True)
+
+
+def _freeze(value) -> Tuple:
+    """Hashable form of a configuration value which keeps container types,
+    so e.g. tuples and lists or 1 and True do not compare equal"""
+    if isinstance(value, dict):
+        items = tuple(sorted((_freeze(k), _freeze(v)) for k, v in value.items()))
+        return (dict, items)
+    if isinstance(value, (list, tuple)):
+        return (type(value), tuple(_freeze(v) for v in value))
+    hash(value)
+    return (type(value), value)
+
+
+class _ConfigDictKey:
+    """Cache key for a configuration dictionary, compared by value"""
+
+    def __init__(self, data: Dict[str, Any]):
+        self.data = data
+        self._frozen = _freeze(data)
+        self._hash = hash(self._frozen)
+
+    def __hash__(self):
+        return self._hash
+
+    def __eq__(self, other):
+        return isinstance(other, _ConfigDictKey) and self._frozen == other._frozen
+
+
+@functools.lru_cache(maxsize=32)
+def _from_dict_cached(data_class: type, key: _ConfigDictKey):
+    config = dacite.from_dict(
+        data_class=data_class, data=key.data, config=_STRICT_DACITE_CONFIG
+    )
+    # the cache compares keys by value, do not keep the caller's dictionary
+    key.data = None
+    return config
+
+
+def _sub_config_from_dict(data_class: type, data: Dict[str, Any]):
+    """
+    Convert a sub-configuration dictionary into its dataclass, re-using
+    the result of previous conversions of identical dictionaries.
+
+    The returned instance is a shallow copy, as DriverConfig.from_dict sets
+    some of its attributes.
+    """
+    try:
+        key = _ConfigDictKey(data)
+    except TypeError:
+        # data holds unhashable values, so cannot be used as a cache key
+        return dacite.from_dict(
+            data_class=data_class, data=data, config=_STRICT_DACITE_CONFIG
+        )
+    return copy.copy(_from_dict_cached(data_class, key))
+
 
 @dataclasses.dataclass(frozen=True)
 class DriverConfig:
@@ -126,17 +184,15 @@ class DriverConfig:
                         "as it is determined based on top-level configuration"
                     )
 
-            kwargs["dycore_config"] = dacite.from_dict(
+            kwargs["dycore_config"] = _sub_config_from_dict(
                 data_class=fv3core.DynamicalCoreConfig,
                 data=kwargs.get("dycore_config", {}),
-                config=dacite.Config(strict=True),
             )
 
         if isinstance(kwargs["physics_config"], dict):
-            kwargs["physics_config"] = dacite.from_dict(
+            kwargs["physics_config"] = _sub_config_from_dict(
                 data_class=fv3gfs.physics.PhysicsConfig,
                 data=kwargs.get("physics_config", {}),
-                config=dacite.Config(strict=True),
             )
 
         kwargs["layout"] = tuple(kwargs["layout"])
@@ -159,7 +215,7 @@ class DriverConfig:
         )
 
         return dacite.from_dict(
-            data_class=cls, data=kwargs, config=dacite.Config(strict=True)
+            data_class=cls, data=kwargs, config=_STRICT_DACITE_CONFIG
         )
 
 
@@ -204,7 +260,10 @@ class Driver:
             self.state = self.config.initialization.get_driver_state(
                 quantity_factory=self.quantity_factory, communicator=communicator
             )
-            self._start_time = self.config.initialization.start_time
+            # bind the sub-states used on every physics step
+            self._dycore_state = self.state.dycore_state
+            self._physics_state = self.state.physics_state
+            self._tendency_state = self.state.tendency_state
             self.dycore = fv3core.DynamicalCore(
                 comm=communicator,
                 grid_data=self.state.grid_data,
@@ -264,12 +323,12 @@ class Driver:
         if config.diagnostics_config.output_initial_state:
             self.diagnostics.store(time=self.time, state=self.state)
 
-        self._time_run = self.config.start_time
-
     @dace_inhibitor
-    def _callback_diagnostics(self):
-        self._time_run += self.config.timestep
-        self.diagnostics.store(time=self._time_run, state=self.state)
+    def _callback_diagnostics(self, time_step: int):
+        # the orchestrated loop only counts timesteps, model time is
+        # constructed here from the time at loop entry when needed for output
+        time = self._loop_start_time + (time_step + 1) * self.config.timestep
+        self.diagnostics.store(time=time, state=self.state)
 
     @dace_inhibitor
     def _callback_restart(self, restart_path: str):
@@ -298,7 +357,7 @@ class Driver:
                 timer=self.performance_config.timestep_timer,
             )
             if (t % time_step_io_freq) == 0:
-                self._callback_diagnostics()
+                self._callback_diagnostics(t)
             if t in intermediate_restart:
                 self._callback_restart(restart_path=f"RESTART_{t}")
 
@@ -315,28 +374,31 @@ class Driver:
                 logger.info(f"  time_steps: {time_steps}")
                 if not self.config.disable_step_physics:
                     raise RuntimeError("DaCe orchestration doesn't handle physics.")
+                self._loop_start_time = self.time
                 self.dycore_only_loop_orchestrated(
                     state=self.state.dycore_state,
                     time_steps=time_steps,
-                    time_step_io_freq=(
-                        self.config.diagnostics_config.output_frequency,
-                    ),
+                    time_step_io_freq=self.config.diagnostics_config.output_frequency,
                     intermediate_restart=self.config.intermediate_restart,
                 )
+                self.time += time_steps * self.config.timestep
             else:
+                # bind loop-invariant lookups once rather than on every step
+                timestep = self.config.timestep
+                output_frequency = self.config.diagnostics_config.output_frequency
+                save_intermediate_restart = self.restart.save_intermediate_restart
+                intermediate_restart = self.config.intermediate_restart
+                step = self.step
+                store_diagnostics = self.diagnostics.store
                 timestep_counter = 0
                 while self.time < end_time:
-                    self.step(timestep=self.config.timestep)
+                    step(timestep=timestep)
                     timestep_counter += 1
+                    if timestep_counter % output_frequency == 0:
+                        store_diagnostics(time=self.time, state=self.state)
                     if (
-                        timestep_counter
-                        % self.config.diagnostics_config.output_frequency
-                        == 0
-                    ):
-                        self.diagnostics.store(time=self.time, state=self.state)
-                    if (
-                        self.restart.save_intermediate_restart
-                        and timestep_counter in self.config.intermediate_restart
+                        save_intermediate_restart
+                        and timestep_counter in intermediate_restart
                     ):
                         self._write_restart_files(
                             restart_path=f"RESTART_{timestep_counter}"
@@ -364,19 +426,20 @@ class Driver:
         )
 
     def _step_physics(self, timestep: float):
+        dt = float(timestep)
         self.dycore_to_physics(
-            dycore_state=self.state.dycore_state,
-            physics_state=self.state.physics_state,
-            tendency_state=self.state.tendency_state,
-            timestep=float(timestep),
+            dycore_state=self._dycore_state,
+            physics_state=self._physics_state,
+            tendency_state=self._tendency_state,
+            timestep=dt,
         )
         if not self.config.dycore_only:
-            self.physics(self.state.physics_state, timestep=float(timestep))
+            self.physics(self._physics_state, timestep=dt)
         self.end_of_step_update(
-            dycore_state=self.state.dycore_state,
-            phy_state=self.state.physics_state,
-            tendency_state=self.state.tendency_state,
-            dt=float(timestep),
+            dycore_state=self._dycore_state,
+            phy_state=self._physics_state,
+            tendency_state=self._tendency_state,
+            dt=dt,
         )
 
     def _write_performance_json_output(self):
@@ -403,6 +466,7 @@ class Driver:
         logger.info("cleaning up driver")
         if self.config.save_restart:
             self._write_restart_files()
+        self.diagnostics.cleanup()
         self._write_performance_json_output()
         self.comm_config.cleanup(self.comm)
 
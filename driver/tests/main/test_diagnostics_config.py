@@ -25,6 +25,8 @@ def test_returns_zarr_diagnostics_if_path_given(tmpdir):
             names=["foo"],
             partitioner=unittest.mock.ANY,
             comm=unittest.mock.ANY,
+            z_chunk_size=None,
+            dtype=None,
         )
 
 
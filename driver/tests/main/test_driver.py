@@ -7,8 +7,10 @@ from typing import Literal, Tuple
 
 import pytest
 
+import fv3core
 import pace.dsl
 from pace.driver import CreatesComm, Driver, DriverConfig
+from pace.driver.driver import _sub_config_from_dict
 from pace.driver.report import (
     TimeReport,
     gather_hit_counts,
@@ -91,6 +93,20 @@ def test_total_time(days, hours, minutes, seconds, expected):
     assert config.total_time == expected
 
 
+def test_sub_config_from_dict_keeps_tuple_fields():
+    data = {"layout": (2, 2), "npx": 13}
+    first = _sub_config_from_dict(fv3core.DynamicalCoreConfig, data)
+    second = _sub_config_from_dict(fv3core.DynamicalCoreConfig, data)
+    assert first.layout == (2, 2)
+    assert first.npx == 13
+    # DriverConfig.from_dict sets attributes of the result, so each call
+    # must return its own instance
+    assert first is not second
+    first.npx = 25
+    assert second.npx == 13
+    assert _sub_config_from_dict(fv3core.DynamicalCoreConfig, data).npx == 13
+
+
 @pytest.mark.parametrize(
     "timestep, minutes",
     [
@@ -1,3 +1,4 @@
+import copy
 import os
 from typing import List
 
@@ -48,3 +49,16 @@ def test_example_config_can_initialize(filename):
     with open(os.path.join(EXAMPLE_CONFIGS_DIR, filename), "r") as f:
         config = pace.driver.DriverConfig.from_dict(yaml.safe_load(f))
     assert isinstance(config, pace.driver.DriverConfig)
+
+
+def test_configs_from_equal_dicts_do_not_share_sub_configs():
+    with open(os.path.join(EXAMPLE_CONFIGS_DIR, "baroclinic_c12.yaml"), "r") as f:
+        config_dict = yaml.safe_load(f)
+    larger_config_dict = copy.deepcopy(config_dict)
+    larger_config_dict["nx_tile"] = 2 * config_dict["nx_tile"]
+    config = pace.driver.DriverConfig.from_dict(config_dict)
+    larger_config = pace.driver.DriverConfig.from_dict(larger_config_dict)
+    assert config.dycore_config is not larger_config.dycore_config
+    assert config.physics_config is not larger_config.physics_config
+    assert config.dycore_config.npx == config.nx_tile + 1
+    assert larger_config.dycore_config.npx == larger_config.nx_tile + 1
@@ -1,4 +1,4 @@
-import os.path
+import os
 from typing import Any, Callable, Dict, Optional, Tuple
 
 import yaml
@@ -156,6 +156,100 @@ def top_tile_equivalent(rank, size):
     return rank % tilesize
 
 
+################################################
+
+################################################
+# Build cache keyed on the SDFG content
+
+_SDFG_HASH_FILENAME = "pace_sdfg_hash"
+
+
+def _sdfg_hash_path(build_folder: str) -> str:
+    return os.path.join(build_folder, _SDFG_HASH_FILENAME)
+
+
+def is_build_cached(build_folder: str, sdfg_hash: str) -> bool:
+    """Return True if build_folder holds a library compiled from an SDFG
+    with the given hash.
+
+    The hash covers array shapes and constants, so a build is only re-used
+    for the same domain, layout and configuration.
+    """
+    try:
+        with open(_sdfg_hash_path(build_folder), "r") as f:
+            return f.read() == sdfg_hash
+    except FileNotFoundError:
+        return False
+
+
+def write_build_hash(build_folder: str, sdfg_hash: str) -> None:
+    """Record the hash of the SDFG compiled into build_folder.
+
+    Written to a temporary file then renamed, so an interrupted write never
+    leaves a truncated hash next to the build.
+    """
+    hash_path = _sdfg_hash_path(build_folder)
+    tmp_path = f"{hash_path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w") as f:
+        f.write(sdfg_hash)
+    os.replace(tmp_path, hash_path)
+
+
+def sdfg_hash_supported() -> bool:
+    """Return True if the installed DaCe can hash SDFG content.
+
+    The build caches below are keyed on that hash and are skipped without it.
+    """
+    import dace
+
+    return hasattr(dace.SDFG, "hash_sdfg")
+
+
+def transformed_sdfg_key(sdfg, backend: str, pipeline_hash: str) -> str:
+    """Key of the transformed version of an (untransformed) SDFG.
+
+    Covers the SDFG content, the DaCe version, the backend and pipeline_hash,
+    which must change whenever the transformations applied to the SDFG do.
+    """
+    import hashlib
+
+    import dace
+
+    key = f"{dace.__version__}:{backend}:{pipeline_hash}:{sdfg.hash_sdfg()}"
+    return hashlib.sha256(key.encode()).hexdigest()
+
+
+def _transformed_sdfg_path(build_folder: str, key: str) -> str:
+    return os.path.join(build_folder, f"{key}.post_expand.sdfg")
+
+
+def load_transformed_sdfg(build_folder: str, key: str):
+    """Return the transformed SDFG saved under key, or None if there is none
+    or it cannot be read"""
+    import dace
+
+    path = _transformed_sdfg_path(build_folder, key)
+    if not os.path.isfile(path):
+        return None
+    try:
+        return dace.SDFG.from_file(path)
+    except Exception:
+        # unreadable file, e.g. left by an interrupted save: transform again
+        return None
+
+
+def save_transformed_sdfg(sdfg, build_folder: str, key: str) -> None:
+    """Save a transformed SDFG so later builds can skip the transformations.
+
+    Saved to a temporary file then renamed, so readers never see a partial file.
+    """
+    os.makedirs(build_folder, exist_ok=True)
+    path = _transformed_sdfg_path(build_folder, key)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    sdfg.save(tmp_path)
+    os.replace(tmp_path, path)
+
+
 ################################################
 
 ################################################
@@ -11,9 +11,15 @@ from dace.transformation.helpers import get_parent_map
 
 from pace.dsl.dace.build import (
     determine_compiling_ranks,
+    is_build_cached,
     load_sdfg_once,
+    load_transformed_sdfg,
     read_target_rank,
+    save_transformed_sdfg,
+    sdfg_hash_supported,
+    transformed_sdfg_key,
     unblock_waiting_tiles,
+    write_build_hash,
     write_decomposition,
 )
 from pace.dsl.dace.dace_config import DaceConfig, DaCeOrchestration
@@ -22,16 +28,66 @@ from pace.dsl.dace.utils import DaCeProgress
 from pace.util.mpi import MPI
 
 
+try:
+    import cupy as cp
+except ImportError:
+    cp = None
+
+# Instance attribute caching the orchestrated callables bound to that instance
+_PACE_SDFG_CACHE_KEY = "_pace_sdfg_enabled_callables"
+
+# Methods resolved (and flagged with their dace.constant arguments) by
+# orchestrate, keyed on class, method name and constant arguments
+_ORCHESTRATED_FUNC_CACHE: Dict[Tuple[type, str, Tuple[str, ...]], Callable] = {}
+
+# Class attribute caching the patched subclass of an orchestrated class,
+# see _patched_call_class
+_PATCHED_CLASS_KEY = "_pace_patched_call_class"
+
+
 def dace_inhibitor(func: Callable):
     """Triggers callback generation wrapping `func` while doing DaCe parsing."""
     return func
 
 
-def upload_to_device(host_data: List[Any]):
+def _arguments_signature(args, kwargs) -> Tuple:
+    """Cheap key describing the type, shape and dtype of the call arguments"""
+    return tuple(
+        (type(a), getattr(a, "shape", None), getattr(a, "dtype", None)) for a in args
+    ) + tuple(
+        (k, type(v), getattr(v, "shape", None), getattr(v, "dtype", None))
+        for k, v in sorted(kwargs.items())
+    )
+
+
+# Stream used to batch host to device uploads, created on first use
+_UPLOAD_STREAM: Optional["cp.cuda.Stream"] = None
+
+
+def _get_upload_stream() -> "cp.cuda.Stream":
+    global _UPLOAD_STREAM
+    if _UPLOAD_STREAM is None:
+        _UPLOAD_STREAM = cp.cuda.Stream(non_blocking=True)
+    return _UPLOAD_STREAM
+
+
+def upload_to_device(config: DaceConfig, host_data: List[Any]):
     """Make sure any data that are still a gt4py.storage gets uploaded to device"""
-    for data in host_data:
-        if isinstance(data, gt4py.storage.Storage):
+    if not config.is_gpu_backend():
+        # host_to_device is a no-op for CPU storages
+        return
+    storages = [data for data in host_data if isinstance(data, gt4py.storage.Storage)]
+    if cp is None:
+        for data in storages:
             data.host_to_device()
+    else:
+        # Enqueue all copies on a single stream and synchronize once,
+        # rather than paying a synchronization per storage
+        stream = _get_upload_stream()
+        with stream:
+            for data in storages:
+                data.host_to_device()
+        stream.synchronize()
 
 
 def download_results_from_dace(
@@ -45,61 +101,132 @@ def download_results_from_dace(
                 arg, "_set_device_modified"
             ):
                 arg._set_device_modified()
+        backend = config.get_backend()
+        # Results already handed back as gt4py storages are used as is,
+        # only raw arrays are copied into a new storage
         if config.is_gpu_backend():
             gt4py_results = [
-                gt4py.storage.from_array(
+                r
+                if isinstance(r, gt4py.storage.Storage)
+                else gt4py.storage.from_array(
                     r,
                     default_origin=(0, 0, 0),
-                    backend=config.get_backend(),
+                    backend=backend,
                     managed_memory=True,
                 )
                 for r in dace_result
             ]
         else:
             gt4py_results = [
-                gt4py.storage.from_array(
-                    r, default_origin=(0, 0, 0), backend=config.get_backend()
+                r
+                if isinstance(r, gt4py.storage.Storage)
+                else gt4py.storage.from_array(
+                    r, default_origin=(0, 0, 0), backend=backend
                 )
                 for r in dace_result
             ]
     return gt4py_results
 
 
+def _is_scalarizable(arr: dace.data.Data) -> bool:
+    """Arrays of shape (1,) can live in registers"""
+    shape = arr.shape
+    return len(shape) == 1 and shape[0] == 1
+
+
 def to_gpu(sdfg: dace.SDFG):
     """Flag memory in SDFG to GPU.
     Force deactivate OpenMP sections for sanity."""
 
-    # Gather all maps
-    allmaps = [
-        (me, state)
-        for me, state in sdfg.all_nodes_recursive()
-        if isinstance(me, dace.nodes.MapEntry)
-    ]
-    topmaps = [
-        (me, state) for me, state in allmaps if get_parent_map(state, me) is None
-    ]
-
-    # Set storage of arrays to GPU, scalarizable arrays will be set on registers
-    for sd, _aname, arr in sdfg.arrays_recursive():
-        if arr.shape == (1,):
-            arr.storage = dace.StorageType.Register
-        else:
-            arr.storage = dace.StorageType.GPU_Global
-
-    # All maps will be scedule on GPU
-    for mapentry, state in topmaps:
-        mapentry.schedule = dace.ScheduleType.GPU_Device
-
-    # Deactivate OpenMP sections
+    # Single walk over every (nested) SDFG rather than one pass per property
     for sd in sdfg.all_sdfgs_recursive():
+        # Deactivate OpenMP sections
         sd.openmp_sections = False
 
+        # Set storage of arrays to GPU, scalarizable arrays will be set on registers
+        for arr in sd.arrays.values():
+            if _is_scalarizable(arr):
+                arr.storage = dace.StorageType.Register
+            else:
+                arr.storage = dace.StorageType.GPU_Global
+
+        # All top-level maps will be scheduled on GPU
+        for state in sd.nodes():
+            for node in state.nodes():
+                if (
+                    isinstance(node, dace.nodes.MapEntry)
+                    and get_parent_map(state, node) is None
+                ):
+                    node.schedule = dace.ScheduleType.GPU_Device
+
 
 def run_sdfg(daceprog: DaceProgram, config: DaceConfig, args, kwargs):
     """Execute a compiled SDFG - do not check for compilation"""
-    upload_to_device(list(args) + list(kwargs.values()))
+    all_inputs = [*args, *kwargs.values()]
+    upload_to_device(config, all_inputs)
     res = daceprog(*args, **kwargs)
-    return download_results_from_dace(config, res, list(args) + list(kwargs.values()))
+    return download_results_from_dace(config, res, all_inputs)
+
+
+def _post_barrier():
+    """Post a non-blocking barrier on COMM_WORLD and return its request.
+
+    Falls back to a blocking barrier (and a null request) for MPI < 3.0
+    """
+    if MPI.Get_version() >= (3, 0):
+        return MPI.COMM_WORLD.Ibarrier()
+    MPI.COMM_WORLD.Barrier()
+    return MPI.REQUEST_NULL
+
+
+def _transform_sdfg(sdfg: dace.SDFG, config: DaceConfig):
+    """Promote scalars, simplify, expand library nodes and strip unused globals"""
+    # Promote scalar
+    from dace.sdfg.analysis import scalar_to_symbol as scal2sym
+
+    with DaCeProgress(config, "Scalar promotion"):
+        for sd in sdfg.all_sdfgs_recursive():
+            scal2sym.promote_scalars_to_symbols(sd)
+
+    with DaCeProgress(config, "Simplify (1 of 2)"):
+        sdfg.simplify(validate=False)
+
+    # Perform pre-expansion fine tuning
+    # WARNING: Deactivate until expansion is in gt4py/master
+    # splittable_region_expansion(sdfg)
+
+    # Expand the stencil computation Library Nodes with the right expansion
+    with DaCeProgress(config, "Expand"):
+        sdfg.expand_library_nodes()
+
+    # Simplify again after expansion
+    with DaCeProgress(config, "Simplify (final)"):
+        sdfg.simplify(validate=False)
+
+    with DaCeProgress(config, "Removed unused globals of compute_x_flux (lower VRAM)"):
+        strip_unused_global_in_compute_x_flux(sdfg)
+
+
+def _transform_pipeline_hash() -> str:
+    """Hash of the transformations applied by _transform_sdfg: its source, the
+    source of the pace passes it calls and the gt4py version, whose library
+    node expansions it runs"""
+    import hashlib
+    import inspect
+
+    import pace.dsl.dace.sdfg_opt_passes as sdfg_opt_passes
+
+    source = inspect.getsource(_transform_sdfg) + inspect.getsource(sdfg_opt_passes)
+    gt4py_version = getattr(gt4py, "__version__", "")
+    return hashlib.sha256(f"{gt4py_version}:{source}".encode()).hexdigest()
+
+
+def _is_transform_of(transformed: dace.SDFG, sdfg: dace.SDFG) -> bool:
+    """Whether a cached transformed SDFG can stand in for sdfg: it must build
+    to the same folder and take no argument the daceprog does not pass"""
+    return transformed.name == sdfg.name and set(transformed.arglist()) <= set(
+        sdfg.arglist()
+    )
 
 
 def build_sdfg(
@@ -107,6 +234,7 @@ def build_sdfg(
 ):
     """Build the .so out of the SDFG on the top tile ranks only"""
     is_compiling, comm = determine_compiling_ranks(config)
+    all_inputs = [*args, *kwargs.values()]
     if is_compiling:
         if comm and comm.Get_rank() == 0 and comm.Get_size() > 1:
             write_decomposition(config)
@@ -116,53 +244,57 @@ def build_sdfg(
             make_transients_persistent(sdfg=sdfg, device=dace.dtypes.DeviceType.GPU)
         else:
             for sd, _aname, arr in sdfg.arrays_recursive():
-                if arr.shape == (1,):
+                if _is_scalarizable(arr):
                     arr.storage = dace.StorageType.Register
             make_transients_persistent(sdfg=sdfg, device=dace.dtypes.DeviceType.CPU)
 
         # Upload args to device
-        upload_to_device(list(args) + list(kwargs.values()))
+        upload_to_device(config, all_inputs)
 
         # Build non-constants & non-transients from the sdfg_kwargs
-        sdfg_kwargs = daceprog._create_sdfg_args(sdfg, args, kwargs)
-        for k in daceprog.constant_args:
-            if k in sdfg_kwargs:
-                del sdfg_kwargs[k]
-        sdfg_kwargs = {k: v for k, v in sdfg_kwargs.items() if v is not None}
-        for k, tup in daceprog.resolver.closure_arrays.items():
-            if k in sdfg_kwargs and tup[1].transient:
-                del sdfg_kwargs[k]
-
-        # Promote scalar
-        from dace.sdfg.analysis import scalar_to_symbol as scal2sym
-
-        with DaCeProgress(config, "Scalar promotion"):
-            for sd in sdfg.all_sdfgs_recursive():
-                scal2sym.promote_scalars_to_symbols(sd)
-
-        with DaCeProgress(config, "Simplify (1 of 2)"):
-            sdfg.simplify(validate=False)
-
-        # Perform pre-expansion fine tuning
-        # WARNING: Deactivate until expansion is in gt4py/master
-        # splittable_region_expansion(sdfg)
-
-        # Expand the stencil computation Library Nodes with the right expansion
-        with DaCeProgress(config, "Expand"):
-            sdfg.expand_library_nodes()
-
-        # Simplify again after expansion
-        with DaCeProgress(config, "Simplify (final)"):
-            sdfg.simplify(validate=False)
+        dropped_args = set(daceprog.constant_args) | {
+            k for k, tup in daceprog.resolver.closure_arrays.items() if tup[1].transient
+        }
+        sdfg_kwargs = {
+            k: v
+            for k, v in daceprog._create_sdfg_args(sdfg, args, kwargs).items()
+            if v is not None and k not in dropped_args
+        }
+
+        # Transform, re-using the result of a previous build when it was
+        # made from the same SDFG
+        transform_key = None
+        transformed = None
+        if sdfg_hash_supported():
+            transform_key = transformed_sdfg_key(
+                sdfg, config.get_backend(), _transform_pipeline_hash()
+            )
+            transformed = load_transformed_sdfg(sdfg.build_folder, transform_key)
+        if transformed is not None and not _is_transform_of(transformed, sdfg):
+            transformed = None
+        if transformed is None:
+            _transform_sdfg(sdfg, config)
+            if transform_key is not None:
+                save_transformed_sdfg(sdfg, sdfg.build_folder, transform_key)
+        else:
+            DaCeProgress.log(
+                f"[{config.get_orchestrate()}]", "Loaded cached transformed SDFG"
+            )
+            sdfg = transformed
 
+        # Compile, re-using the library of a previous run if it was built
+        # from the same SDFG
+        sdfg_hash = sdfg.hash_sdfg() if sdfg_hash_supported() else None
+        use_cache = sdfg_hash is not None and is_build_cached(
+            sdfg.build_folder, sdfg_hash
+        )
         with DaCeProgress(
-            config, "Removed unused globals of compute_x_flux (lower VRAM)"
+            config, "Load cached build" if use_cache else "Codegen & compile"
         ):
-            strip_unused_global_in_compute_x_flux(sdfg)
-
-        # Compile
-        with DaCeProgress(config, "Codegen & compile"):
-            sdfg.compile()
+            with dace.config.set_temporary("compiler", "use_cache", value=use_cache):
+                sdfg.compile()
+        if sdfg_hash is not None and not use_cache:
+            write_build_hash(sdfg.build_folder, sdfg_hash)
 
     # Compilation done, either exit or scatter/gather and run
     if config.get_orchestrate() == DaCeOrchestration.Build:
@@ -170,15 +302,18 @@ def build_sdfg(
         DaCeProgress.log(config, "Compilation finished and saved, exiting.")
         exit(0)
     elif config.get_orchestrate() == DaCeOrchestration.BuildAndRun:
-        MPI.COMM_WORLD.Barrier()
+        barrier = _post_barrier()
         if is_compiling:
+            # Run as soon as our own build is done, other compiling ranks
+            # complete the barrier in the background
             unblock_waiting_tiles(comm, sdfg.build_folder)
             with DaCeProgress(config, "Run"):
                 res = sdfg(**sdfg_kwargs)
-                res = download_results_from_dace(
-                    config, res, list(args) + list(kwargs.values())
-                )
+                res = download_results_from_dace(config, res, all_inputs)
+            barrier.Wait()
         else:
+            # Decomposition file is written by a compiling rank, wait for it
+            barrier.Wait()
             from gt4py import config as gt_config
 
             config_path = (
@@ -194,6 +329,27 @@ def build_sdfg(
         return res
 
 
+def _load_sdfg(
+    daceprog: DaceProgram,
+    sdfg_path: str,
+    sdfg_path_is_file: Dict[str, bool],
+    args,
+    kwargs,
+):
+    """Load a .sdfg file or a precompiled SDFG directory into daceprog
+
+    sdfg_path_is_file records, per path, whether it is a .sdfg file (True) or a
+    build directory (False), so the path is probed once per wrapper: stat can
+    be slow on shared filesystems.
+    """
+    if sdfg_path not in sdfg_path_is_file:
+        sdfg_path_is_file[sdfg_path] = os.path.isfile(sdfg_path)
+    if sdfg_path_is_file[sdfg_path]:
+        daceprog.load_sdfg(sdfg_path, *args, **kwargs)
+    else:
+        daceprog.load_precompiled_sdfg(sdfg_path, *args, **kwargs)
+
+
 def call_sdfg(daceprog: DaceProgram, sdfg: dace.SDFG, config: DaceConfig, args, kwargs):
     """Dispatch the SDFG execution and/or build"""
     if (
@@ -221,9 +377,12 @@ class _LazyComputepathFunction(SDFGConvertible):
     def __init__(self, func: Callable, config: DaceConfig):
         self.func = func
         self.config = config
-        self.daceprog = dace.program(self.func)
+        self.daceprog = dace.program(func)
         self._sdfg_loaded = False
+        self._sdfg_path_is_file: Dict[str, bool] = {}
         self._sdfg = None
+        # Loaded SDFGs keyed on the arguments signature
+        self._sdfg_cache: Dict[Tuple, Any] = {}
 
     def __call__(self, *args, **kwargs):
         assert self.config.is_dace_orchestrated()
@@ -245,6 +404,9 @@ class _LazyComputepathFunction(SDFGConvertible):
         self.daceprog.global_vars = value
 
     def __sdfg__(self, *args, **kwargs):
+        signature = _arguments_signature(args, kwargs)
+        if signature in self._sdfg_cache:
+            return self._sdfg_cache[signature]
         sdfg_path = load_sdfg_once(self.func, self.config)
         if not self._sdfg_loaded and sdfg_path is None:
             return self.daceprog.to_sdfg(
@@ -256,13 +418,13 @@ class _LazyComputepathFunction(SDFGConvertible):
             )
         else:
             if not self._sdfg_loaded:
-                if os.path.isfile(sdfg_path):
-                    self.daceprog.load_sdfg(sdfg_path, *args, **kwargs)
-                    self._sdfg_loaded = True
-                else:
-                    self.daceprog.load_precompiled_sdfg(sdfg_path, *args, **kwargs)
-                    self._sdfg_loaded = True
-            return next(iter(self.daceprog._cache.cache.values())).sdfg
+                _load_sdfg(
+                    self.daceprog, sdfg_path, self._sdfg_path_is_file, args, kwargs
+                )
+                self._sdfg_loaded = True
+            sdfg = next(iter(self.daceprog._cache.cache.values())).sdfg
+            self._sdfg_cache[signature] = sdfg
+            return sdfg
 
     def __sdfg_closure__(self, *args, **kwargs):
         return self.daceprog.__sdfg_closure__(*args, **kwargs)
@@ -284,15 +446,19 @@ class _LazyComputepathMethod:
     """
 
     # In order to not regenerate SDFG for the same obj.method callable
-    # we cache the SDFGEnabledCallable we have already init
+    # we cache the SDFGEnabledCallable we have already init.
+    # The cache lives on the instance (see _PACE_SDFG_CACHE_KEY) so it is
+    # released with it; this dict is only a fallback for objects without __dict__
     bound_callables: Dict[Tuple[int, int], "SDFGEnabledCallable"] = dict()
 
     class SDFGEnabledCallable(SDFGConvertible):
         def __init__(self, lazy_method: "_LazyComputepathMethod", obj_to_bind):
-            methodwrapper = dace.method(lazy_method.func)
+            methodwrapper = lazy_method.get_methodwrapper()
             self.obj_to_bind = obj_to_bind
             self.lazy_method = lazy_method
             self.daceprog = methodwrapper.__get__(obj_to_bind)
+            # Loaded SDFGs keyed on the arguments signature
+            self._sdfg_cache: Dict[Tuple, Any] = {}
 
         @property
         def global_vars(self):
@@ -314,6 +480,9 @@ class _LazyComputepathMethod:
             )
 
         def __sdfg__(self, *args, **kwargs):
+            signature = _arguments_signature(args, kwargs)
+            if signature in self._sdfg_cache:
+                return self._sdfg_cache[signature]
             sdfg_path = load_sdfg_once(self.lazy_method.func, self.lazy_method.config)
             if sdfg_path is None:
                 return self.daceprog.to_sdfg(
@@ -324,11 +493,16 @@ class _LazyComputepathMethod:
                     simplify=False,
                 )
             else:
-                if os.path.isfile(sdfg_path):
-                    self.daceprog.load_sdfg(sdfg_path, *args, **kwargs)
-                else:
-                    self.daceprog.load_precompiled_sdfg(sdfg_path, *args, **kwargs)
-                return self.daceprog.__sdfg__(*args, **kwargs)
+                _load_sdfg(
+                    self.daceprog,
+                    sdfg_path,
+                    self.lazy_method.sdfg_path_is_file,
+                    args,
+                    kwargs,
+                )
+                sdfg = self.daceprog.__sdfg__(*args, **kwargs)
+                self._sdfg_cache[signature] = sdfg
+                return sdfg
 
         def __sdfg_closure__(self, reevaluate=None):
             return self.daceprog.__sdfg_closure__(reevaluate)
@@ -344,10 +518,29 @@ class _LazyComputepathMethod:
     def __init__(self, func: Callable, config: DaceConfig):
         self.func = func
         self.config = config
+        self._methodwrapper = None
+        # Whether SDFG paths loaded by the bound callables are .sdfg files
+        self.sdfg_path_is_file: Dict[str, bool] = {}
+
+    def get_methodwrapper(self):
+        """DaCe method wrapper of func, shared by the callables bound from
+        this lazy method and released with it"""
+        if self._methodwrapper is None:
+            self._methodwrapper = dace.method(self.func)
+        return self._methodwrapper
 
     def __get__(self, obj, objtype=None) -> SDFGEnabledCallable:
         """Return SDFGEnabledCallable wrapping original obj.method from cache.
         Update cache first if need be"""
+        obj_dict = getattr(obj, "__dict__", None)
+        if obj_dict is not None:
+            per_obj = obj_dict.setdefault(_PACE_SDFG_CACHE_KEY, {})
+            sdfg_callable = per_obj.get(id(self.func))
+            if sdfg_callable is None:
+                sdfg_callable = _LazyComputepathMethod.SDFGEnabledCallable(self, obj)
+                per_obj[id(self.func)] = sdfg_callable
+            return sdfg_callable
+
         if (id(obj), id(self.func)) not in _LazyComputepathMethod.bound_callables:
 
             _LazyComputepathMethod.bound_callables[
@@ -357,6 +550,43 @@ class _LazyComputepathMethod:
         return _LazyComputepathMethod.bound_callables[(id(obj), id(self.func))]
 
 
+def _patched_call_class(original_class: type) -> type:
+    """Return the subclass of original_class routing __call__ and the SDFG
+    protocol to the instance `_pace_orchestrated_call`. Built once per class
+    and cached on it, so it is released with the class."""
+    # look in the class' own __dict__, a subclass needs its own patched class
+    patched_class = original_class.__dict__.get(_PATCHED_CLASS_KEY)
+    if patched_class is None:
+        # Re: type:ignore
+        # Mypy is unhappy about dynamic class name and the devs (per github
+        # issues discussion) is to make a plugin. Too much work -> ignore mypy
+
+        class _(original_class):  # type: ignore
+            __qualname__ = f"{original_class}_patched"
+            __name__ = f"{original_class}_patched"
+
+            def __call__(self, *arg, **kwarg):
+                return self._pace_orchestrated_call(*arg, **kwarg)
+
+            def __sdfg__(self, *args, **kwargs):
+                return self._pace_orchestrated_call.__sdfg__(*args, **kwargs)
+
+            def __sdfg_closure__(self, reevaluate=None):
+                return self._pace_orchestrated_call.__sdfg_closure__(reevaluate)
+
+            def __sdfg_signature__(self):
+                return self._pace_orchestrated_call.__sdfg_signature__()
+
+            def closure_resolver(self, constant_args, given_args, parent_closure=None):
+                return self._pace_orchestrated_call.closure_resolver(
+                    constant_args, given_args, parent_closure
+                )
+
+        patched_class = _
+        type.__setattr__(original_class, _PATCHED_CLASS_KEY, patched_class)
+    return patched_class
+
+
 def orchestrate(
     obj: object,
     config: DaceConfig,
@@ -377,11 +607,15 @@ def orchestrate(
 
     if config.is_dace_orchestrated():
         if hasattr(obj, method_to_orchestrate):
-            func = type.__getattribute__(type(obj), method_to_orchestrate)
+            key = (type(obj), method_to_orchestrate, tuple(dace_constant_args))
+            func = _ORCHESTRATED_FUNC_CACHE.get(key)
+            if func is None:
+                func = type.__getattribute__(type(obj), method_to_orchestrate)
 
-            # Flag argument as dace.constant
-            for argument in dace_constant_args:
-                func.__annotations__[argument] = DaceConstant
+                # Flag argument as dace.constant
+                for argument in dace_constant_args:
+                    func.__annotations__[argument] = DaceConstant
+                _ORCHESTRATED_FUNC_CACHE[key] = func
 
             # Build DaCe orchestrated wrapper
             # This is a JIT object, e.g. DaCe compilation will happen on call
@@ -399,34 +633,11 @@ def orchestrate(
                 # What we can do is patch the instance.__class__ with a local made class
                 # in order to keep each instance with it's own patch.
                 #
-                # Re: type:ignore
-                # Mypy is unhappy about dynamic class name and the devs (per github
-                # issues discussion) is to make a plugin. Too much work -> ignore mypy
-
-                class _(type(obj)):  # type: ignore
-                    __qualname__ = f"{type(obj)}_patched"
-                    __name__ = f"{type(obj)}_patched"
-
-                    def __call__(self, *arg, **kwarg):
-                        return wrapped(*arg, **kwarg)
-
-                    def __sdfg__(self, *args, **kwargs):
-                        return wrapped.__sdfg__(*args, **kwargs)
-
-                    def __sdfg_closure__(self, reevaluate=None):
-                        return wrapped.__sdfg_closure__(reevaluate)
-
-                    def __sdfg_signature__(self):
-                        return wrapped.__sdfg_signature__()
-
-                    def closure_resolver(
-                        self, constant_args, given_args, parent_closure=None
-                    ):
-                        return wrapped.closure_resolver(
-                            constant_args, given_args, parent_closure
-                        )
-
-                obj.__class__ = _
+                # The patched class is made once per original class and shared by
+                # all its orchestrated instances, each instance carrying its own
+                # wrapped callable (see _patched_call_class).
+                obj._pace_orchestrated_call = wrapped  # type: ignore
+                obj.__class__ = _patched_call_class(type(obj))
             else:
                 # For regular attribute - we can just patch as usual
                 setattr(obj, method_to_orchestrate, wrapped)
@@ -454,13 +665,11 @@ def orchestrate_function(
     """
 
     def _decorator(func: Callable[..., Any]):
-        def _wrapper(*args, **kwargs):
+        if config.is_dace_orchestrated():
+            # Flag argument as dace.constant, once at decoration time
             for argument in dace_constant_args:
                 func.__annotations__[argument] = DaceConstant
             return _LazyComputepathFunction(func, config)
-
-        if config.is_dace_orchestrated():
-            return _wrapper(func)
         else:
             return func
 
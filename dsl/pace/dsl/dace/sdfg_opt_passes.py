@@ -1,3 +1,6 @@
+from collections import defaultdict
+from typing import Any, Dict, List
+
 import dace
 
 
@@ -5,24 +8,42 @@ def strip_unused_global_in_compute_x_flux(sdfg: dace.SDFG):
     """Remove compute_x_flux al & ar variables transient representations that are
     considered as GPU_Global when they are actually transients to the Tasklet
     """
+    # Collect every memlet path to strip first, then remove them in one go
+    to_remove: Dict[dace.SDFGState, List[Any]] = defaultdict(list)
+    declarations: Dict[dace.nodes.Tasklet, List[str]] = defaultdict(list)
+    seen = set()
     for node, state in sdfg.all_nodes_recursive():
         if isinstance(node, dace.nodes.AccessNode) and (
             "al__" in node.data or "ar__" in node.data
         ):
             for e in state.all_edges(node):
+                if e in seen:
+                    continue
+                # memlet_path walks the whole path: compute it once per edge
+                path = state.memlet_path(e)
+                seen.update(path)
+                first, last = path[0], path[-1]
                 tasklet = None
-                if isinstance(state.memlet_path(e)[0].src, dace.nodes.Tasklet):
-                    conn = state.memlet_path(e)[0].src_conn
-                    tasklet = state.memlet_path(e)[0].src
-                elif isinstance(state.memlet_path(e)[-1].dst, dace.nodes.Tasklet):
-                    conn = state.memlet_path(e)[-1].dst_conn
-                    tasklet = state.memlet_path(e)[-1].dst
+                if isinstance(first.src, dace.nodes.Tasklet):
+                    conn = first.src_conn
+                    tasklet = first.src
+                elif isinstance(last.dst, dace.nodes.Tasklet):
+                    conn = last.dst_conn
+                    tasklet = last.dst
                 if tasklet is not None:
-                    code_str = tasklet.code.as_string
                     dtype = state.parent.arrays[e.data.data].dtype
-                    code_str = f"{conn}: dace.{dtype.to_string()}\n" + code_str
-                    tasklet.code.as_string = code_str
-                state.remove_memlet_path(e, True)
+                    declarations[tasklet].append(f"{conn}: dace.{dtype.to_string()}")
+                to_remove[state].append(e)
+
+    # Declare the connectors types, re-writing each tasklet code only once
+    for tasklet, tasklet_declarations in declarations.items():
+        tasklet.code.as_string = (
+            "\n".join(tasklet_declarations) + "\n" + tasklet.code.as_string
+        )
+
+    for state, edges in to_remove.items():
+        for e in edges:
+            state.remove_memlet_path(e, True)
 
 
 def splittable_region_expansion(sdfg: dace.SDFG):
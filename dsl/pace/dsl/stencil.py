@@ -610,6 +610,8 @@ class GridIndexing:
         self.origin = (n_halo, n_halo, 0)
         self.n_halo = n_halo
         self.domain = domain
+        # halo specs are read-only descriptors, built once per set of arguments
+        self._halo_spec_cache: Dict[Tuple, QuantityHaloSpec] = {}
         self.south_edge = south_edge
         self.north_edge = north_edge
         self.west_edge = west_edge
@@ -909,16 +911,65 @@ class GridIndexing:
             n_halo: number of halo points to update, defaults to self.n_halo
             backend: gt4py backend to use
         """
+        return self.get_quantity_halo_specs(
+            shape, origin, [dims], n_halo, backend=backend
+        )[tuple(dims)]
 
-        # TEMPORARY: we do a nasty temporary allocation here to read in the hardware
-        # memory layout. Further work in GT4PY will allow for deferred allocation
-        # which will give access to those information while making sure
-        # we don't allocate
-        # Refactor is filed in ticket DSL-820
+    def get_quantity_halo_specs(
+        self,
+        shape: Tuple[int, ...],
+        origin: Tuple[int, ...],
+        dims_list: Sequence[Sequence[str]],
+        n_halo: Optional[int] = None,
+        *,
+        backend: str,
+    ) -> Dict[Tuple[str, ...], QuantityHaloSpec]:
+        """Build memory specifications for the halo update of several
+        dimensionalities sharing the same storage shape.
 
-        temp_storage = gt4py_utils.make_storage_from_shape(
-            shape, origin, backend=backend
-        )
+        Args:
+            shape: the shape of the Quantity
+            origin: the origin of the compute domain
+            dims_list: dimensionalities of the data
+            n_halo: number of halo points to update, defaults to self.n_halo
+            backend: gt4py backend to use
+
+        Returns:
+            specs: halo specification for each dimensionality, keyed on dims
+        """
+        if n_halo is None:
+            n_halo = self.n_halo
+        specs = {}
+        temp_storage = None
+        for dims in dims_list:
+            key = (
+                tuple(self.origin),
+                tuple(self.domain),
+                tuple(shape),
+                tuple(origin),
+                tuple(dims),
+                n_halo,
+                backend,
+            )
+            if key not in self._halo_spec_cache:
+                # TEMPORARY: we do a nasty temporary allocation here to read in the
+                # hardware memory layout. Further work in GT4PY will allow for
+                # deferred allocation which will give access to those information
+                # while making sure we don't allocate
+                # Refactor is filed in ticket DSL-820
+                if temp_storage is None:
+                    temp_storage = gt4py_utils.make_storage_from_shape(
+                        shape, origin, backend=backend
+                    )
+                self._halo_spec_cache[key] = self._build_quantity_halo_spec(
+                    temp_storage, dims, n_halo
+                )
+            specs[tuple(dims)] = self._halo_spec_cache[key]
+        return specs
+
+    def _build_quantity_halo_spec(
+        self, temp_storage, dims, n_halo: int
+    ) -> QuantityHaloSpec:
         origin, extent = self.get_origin_domain(dims)
         temp_quantity = pace.util.Quantity(
             temp_storage,
@@ -927,10 +978,8 @@ class GridIndexing:
             origin=origin,
             extent=extent,
         )
-        if n_halo is None:
-            n_halo = self.n_halo
 
-        spec = QuantityHaloSpec(
+        return QuantityHaloSpec(
             n_halo,
             temp_quantity.data.strides,
             temp_quantity.data.itemsize,
@@ -942,11 +991,6 @@ class GridIndexing:
             temp_quantity.metadata.dtype,
         )
 
-        del temp_storage
-        del temp_quantity
-
-        return spec
-
 
 class StencilFactory:
     """Configurable class which creates stencil objects."""
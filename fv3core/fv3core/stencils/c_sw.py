@@ -496,17 +496,6 @@ class CGridShallowWaterDynamics:
             self.grid_data.lat,
             backend=stencil_factory.backend,
         )
-        origin_halo1 = (grid_indexing.isc - 1, grid_indexing.jsc - 1, 0)
-        self.delpc = utils.make_storage_from_shape(
-            grid_indexing.max_shape,
-            origin=origin_halo1,
-            backend=stencil_factory.backend,
-        )
-        self.ptc = utils.make_storage_from_shape(
-            grid_indexing.max_shape,
-            origin=origin_halo1,
-            backend=stencil_factory.backend,
-        )
         self._initialize_delpc_ptc = stencil_factory.from_dims_halo(
             initialize_delpc_ptc,
             compute_dims=[X_DIM, Y_DIM, Z_DIM],
@@ -619,6 +608,8 @@ class CGridShallowWaterDynamics:
         vt: FloatField,
         divgd: FloatField,
         omga: FloatField,
+        delpc: FloatField,
+        ptc: FloatField,
         dt2: float,
     ):
         """
@@ -638,12 +629,14 @@ class CGridShallowWaterDynamics:
             vt (out): v * dy
             divgd (out): D-grid horizontal divergence
             omga (out): Vertical pressure velocity
+            delpc (out): C-grid vertical delta in pressure
+            ptc (out): C-grid potential temperature
             dt2 (in): Half a model timestep in seconds
         """
         # TODO: omga is called "wc" inside stencils, consolidate the naming
         self._initialize_delpc_ptc(
-            self.delpc,
-            self.ptc,
+            delpc,
+            ptc,
         )
         self._D2A2CGrid_Vectors(uc, vc, u, v, ua, va, ut, vt)
         if self._divergence_corner is not None:
@@ -693,8 +686,8 @@ class CGridShallowWaterDynamics:
             vt,
             w,
             self.grid_data.rarea,
-            self.delpc,
-            self.ptc,
+            delpc,
+            ptc,
             omga,
             self._tmp_ke,
             self._tmp_vort,
@@ -749,4 +742,3 @@ class CGridShallowWaterDynamics:
             self.grid_data.rdxc,
             dt2,
         )
-        return self.delpc, self.ptc
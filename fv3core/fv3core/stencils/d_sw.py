@@ -16,7 +16,7 @@ from fv3core.stencils.basic_operations import compute_coriolis_parameter_defn
 from fv3core.stencils.d2a2c_vect import contravariant
 from fv3core.stencils.delnflux import DelnFluxNoSG
 from fv3core.stencils.divergence_damping import DivergenceDamping
-from fv3core.stencils.fvtp2d import FiniteVolumeTransport
+from fv3core.stencils.fvtp2d import FiniteVolumeTransport, make_intermediate_storages
 from fv3core.stencils.fxadv import FiniteVolumeFluxPrep
 from fv3core.stencils.xtp_u import advect_u_along_x
 from fv3core.stencils.ytp_v import advect_v_along_y
@@ -749,6 +749,8 @@ class DGridShallowWaterLagrangianDynamics:
             grid_data.rarea,
             self._column_namelist["nord_v"],
         )
+        # the transport instances below are called one after another
+        fvtp2d_storages = make_intermediate_storages(stencil_factory)
         self.fvtp2d_dp = FiniteVolumeTransport(
             stencil_factory=stencil_factory,
             grid_data=grid_data,
@@ -757,6 +759,7 @@ class DGridShallowWaterLagrangianDynamics:
             hord=config.hord_dp,
             nord=self._column_namelist["nord_v"],
             damp_c=self._column_namelist["damp_vt"],
+            intermediate_storages=fvtp2d_storages,
         )
         self.fvtp2d_dp_t = FiniteVolumeTransport(
             stencil_factory=stencil_factory,
@@ -766,6 +769,7 @@ class DGridShallowWaterLagrangianDynamics:
             hord=config.hord_dp,
             nord=self._column_namelist["nord_t"],
             damp_c=self._column_namelist["damp_t"],
+            intermediate_storages=fvtp2d_storages,
         )
         self.fvtp2d_tm = FiniteVolumeTransport(
             stencil_factory=stencil_factory,
@@ -775,6 +779,7 @@ class DGridShallowWaterLagrangianDynamics:
             hord=config.hord_tm,
             nord=self._column_namelist["nord_v"],
             damp_c=self._column_namelist["damp_vt"],
+            intermediate_storages=fvtp2d_storages,
         )
         self.fvtp2d_vt_nodelnflux = FiniteVolumeTransport(
             stencil_factory=stencil_factory,
@@ -782,6 +787,7 @@ class DGridShallowWaterLagrangianDynamics:
             damping_coefficients=damping_coefficients,
             grid_type=config.grid_type,
             hord=config.hord_vt,
+            intermediate_storages=fvtp2d_storages,
         )
         self.fv_prep = FiniteVolumeFluxPrep(
             stencil_factory=stencil_factory,
@@ -1,7 +1,8 @@
 import dataclasses
-from typing import Dict, Optional, Sequence, Union
+from typing import Dict, Optional, Sequence, Tuple, Union
 
 import dace
+import numpy as np
 from dace.frontend.python.interface import nounroll as dace_nounroll
 from gt4py.gtscript import (
     __INLINED,
@@ -49,7 +50,6 @@ def zero_data(
     cyd: FloatField,
     heat_source: FloatField,
     diss_estd: FloatField,
-    first_timestep: bool,
 ):
     """
     Args:
@@ -57,34 +57,53 @@ def zero_data(
         mfyd (out):
         cxd (out):
         cyd (out):
-        heat_source (out):
-        diss_estd (out):
-        first_timestep (in):
+        heat_source (out): only zeroed on the first timestep
+        diss_estd (out): only zeroed on the first timestep
     """
+    from __externals__ import first_timestep
+
     with computation(PARALLEL), interval(...):
         mfxd = 0.0
         mfyd = 0.0
         cxd = 0.0
         cyd = 0.0
-        if first_timestep:
+        if __INLINED(first_timestep):
             with horizontal(region[3:-3, 3:-3]):
                 heat_source = 0.0
                 diss_estd = 0.0
 
 
 # NOTE in Fortran these are columns
-def dp_ref_compute(
+def compute_dp_ref_zs(
     ak: FloatFieldK,
     bk: FloatFieldK,
     phis: FloatFieldIJ,
-    dp_ref: FloatField,
-    zs: FloatField,
-    rgrav: float,
-):
-    with computation(PARALLEL), interval(0, -1):
-        dp_ref = ak[1] - ak + (bk[1] - bk) * 1.0e5
-    with computation(PARALLEL), interval(...):
-        zs = phis * rgrav
+    grid_indexing: GridIndexing,
+    *,
+    backend: str,
+) -> Tuple[FloatFieldK, FloatFieldIJ]:
+    """
+    Compute the reference pressure thickness dp_ref (K-field) and the
+    surface height zs (IJ-field).
+
+    Only run at initialization, gt4py stencils cannot write lower
+    dimensional fields so this is done on host arrays.
+    """
+    nx, ny, _ = grid_indexing.domain_full()
+    nk = grid_indexing.domain[2]
+    ak = utils.asarray(ak)
+    bk = utils.asarray(bk)
+    phis = utils.asarray(phis)
+
+    dp_ref = np.zeros(grid_indexing.max_shape[2])
+    dp_ref[:nk] = ak[1 : nk + 1] - ak[:nk] + (bk[1 : nk + 1] - bk[:nk]) * 1.0e5
+    zs = np.zeros(grid_indexing.max_shape[0:2])
+    zs[:nx, :ny] = phis[:nx, :ny] * (1.0 / constants.GRAV)
+
+    return (
+        utils.make_storage_data(dp_ref, dp_ref.shape, (0,), backend=backend),
+        utils.make_storage_data(zs, zs.shape, (0, 0), backend=backend),
+    )
 
 
 def set_gz(zs: FloatFieldIJ, delz: FloatField, gz: FloatField):
@@ -184,7 +203,29 @@ def _quantity_wrap(storage, dims: Sequence[str], grid_indexing: GridIndexing):
     )
 
 
-def dyncore_temporaries(grid_indexing: GridIndexing, *, backend: str):
+@dataclasses.dataclass(frozen=True)
+class DynCoreTemporaries:
+    """Temporary fields of the acoustic dynamics, attached to the state"""
+
+    ut: FloatField
+    vt: FloatField
+    gz: pace.util.Quantity
+    zh: pace.util.Quantity
+    pem: FloatField
+    pkc: pace.util.Quantity
+    pk3: FloatField
+    heat_source: pace.util.Quantity
+    divgd: pace.util.Quantity
+    ws3: FloatFieldIJ
+    crx: FloatField
+    xfx: FloatField
+    cry: FloatField
+    yfx: FloatField
+
+
+def dyncore_temporaries(
+    grid_indexing: GridIndexing, *, backend: str
+) -> DynCoreTemporaries:
     tmps: Dict[str, Union[pace.util.Quantity, "FloatField"]] = {}
     utils.storage_dict(
         tmps,
@@ -229,7 +270,7 @@ def dyncore_temporaries(grid_indexing: GridIndexing, *, backend: str):
             grid_indexing=grid_indexing,
         )
 
-    return tmps
+    return DynCoreTemporaries(**tmps)
 
 
 class AcousticDynamics:
@@ -247,31 +288,34 @@ class AcousticDynamics:
             self._qtx_x_names = qty_x_names
             self._qtx_y_names = qty_y_names
             self._comm = comm
+            # Quantities are resolved from the state on first use, then re-used
+            self._qty_x = None
+            self._qty_y = None
+
+        def _get_quantities(self, names):
+            if dataclasses.is_dataclass(self._state):
+                return [self._state.__getattribute__(name) for name in names]
+            elif isinstance(self._state, dict):
+                return [self._state[name] for name in names]
+            else:
+                raise NotImplementedError
+
+        def invalidate(self):
+            """Resolve the quantities from the state again on next use,
+            must be called if the state attributes have been re-bound"""
+            self._qty_x = None
+            self._qty_y = None
 
         @dace_inhibitor
         def start(self):
+            if self._qty_x is None:
+                self._qty_x = self._get_quantities(self._qtx_x_names)
+                if self._qtx_y_names is not None:
+                    self._qty_y = self._get_quantities(self._qtx_y_names)
             if self._qtx_y_names is None:
-                if dataclasses.is_dataclass(self._state):
-                    self._updater.start(
-                        [self._state.__getattribute__(x) for x in self._qtx_x_names]
-                    )
-                elif isinstance(self._state, dict):
-                    self._updater.start([self._state[x] for x in self._qtx_x_names])
-                else:
-                    raise NotImplementedError
+                self._updater.start(self._qty_x)
             else:
-                if dataclasses.is_dataclass(self._state):
-                    self._updater.start(
-                        [self._state.__getattribute__(x) for x in self._qtx_x_names],
-                        [self._state.__getattribute__(y) for y in self._qtx_y_names],
-                    )
-                elif isinstance(self._state, dict):
-                    self._updater.start(
-                        [self._state[x] for x in self._qtx_x_names],
-                        [self._state[y] for y in self._qtx_y_names],
-                    )
-                else:
-                    raise NotImplementedError
+                self._updater.start(self._qty_x, self._qty_y)
 
         @dace_inhibitor
         def wait(self):
@@ -305,41 +349,23 @@ class AcousticDynamics:
             shape = grid_indexing.max_shape
             # Define the memory specification required
             # Those can be re-used as they are read-only descriptors
-            full_size_xyz_halo_spec = grid_indexing.get_quantity_halo_spec(
-                shape,
-                origin,
-                dims=[fv3util.X_DIM, fv3util.Y_DIM, fv3util.Z_DIM],
-                n_halo=grid_indexing.n_halo,
-                backend=backend,
-            )
-            full_size_xyiz_halo_spec = grid_indexing.get_quantity_halo_spec(
+            xyz = (fv3util.X_DIM, fv3util.Y_DIM, fv3util.Z_DIM)
+            xyiz = (fv3util.X_DIM, fv3util.Y_INTERFACE_DIM, fv3util.Z_DIM)
+            xiyz = (fv3util.X_INTERFACE_DIM, fv3util.Y_DIM, fv3util.Z_DIM)
+            xyzi = (fv3util.X_DIM, fv3util.Y_DIM, fv3util.Z_INTERFACE_DIM)
+            xiyiz = (fv3util.X_INTERFACE_DIM, fv3util.Y_INTERFACE_DIM, fv3util.Z_DIM)
+            full_size_halo_specs = grid_indexing.get_quantity_halo_specs(
                 shape,
                 origin,
-                dims=[fv3util.X_DIM, fv3util.Y_INTERFACE_DIM, fv3util.Z_DIM],
-                n_halo=grid_indexing.n_halo,
-                backend=backend,
-            )
-            full_size_xiyz_halo_spec = grid_indexing.get_quantity_halo_spec(
-                shape,
-                origin,
-                dims=[fv3util.X_INTERFACE_DIM, fv3util.Y_DIM, fv3util.Z_DIM],
-                n_halo=grid_indexing.n_halo,
-                backend=backend,
-            )
-            full_size_xyzi_halo_spec = grid_indexing.get_quantity_halo_spec(
-                shape,
-                origin,
-                dims=[fv3util.X_DIM, fv3util.Y_DIM, fv3util.Z_INTERFACE_DIM],
-                n_halo=grid_indexing.n_halo,
-                backend=backend,
-            )
-            full_size_xiyiz_halo_spec = grid_indexing.get_quantity_halo_spec(
-                shape,
-                origin,
-                dims=[fv3util.X_INTERFACE_DIM, fv3util.Y_INTERFACE_DIM, fv3util.Z_DIM],
+                dims_list=[xyz, xyiz, xiyz, xyzi, xiyiz],
                 n_halo=grid_indexing.n_halo,
                 backend=backend,
             )
+            full_size_xyz_halo_spec = full_size_halo_specs[xyz]
+            full_size_xyiz_halo_spec = full_size_halo_specs[xyiz]
+            full_size_xiyz_halo_spec = full_size_halo_specs[xiyz]
+            full_size_xyzi_halo_spec = full_size_halo_specs[xyzi]
+            full_size_xiyiz_halo_spec = full_size_halo_specs[xiyiz]
 
             # Build the HaloUpdater. We could build one updater per specification group
             # but because of call overlap between different variable, we kept the
@@ -348,15 +374,10 @@ class AcousticDynamics:
             # [DaCe] Wrapping call to a DaCe readable halo updater
             #        Biggest parsing issue is that DaCe cannot do
             #        quantities at runtime paradigm
-            self.q_con__cappa = AcousticDynamics._WrappedHaloUpdater(
-                comm.get_scalar_halo_updater([full_size_xyz_halo_spec] * 2),
-                state,
-                ["q_con", "cappa"],
-            )
-            self.delp__pt = AcousticDynamics._WrappedHaloUpdater(
-                comm.get_scalar_halo_updater([full_size_xyz_halo_spec] * 2),
+            self.q_con__cappa__delp__pt = AcousticDynamics._WrappedHaloUpdater(
+                comm.get_scalar_halo_updater([full_size_xyz_halo_spec] * 4),
                 state,
-                ["delp", "pt"],
+                ["q_con", "cappa", "delp", "pt"],
             )
             self.u__v = AcousticDynamics._WrappedHaloUpdater(
                 comm.get_vector_halo_updater(
@@ -423,6 +444,12 @@ class AcousticDynamics:
                 None, state, ["u"], ["v"], comm=comm
             )
 
+        def invalidate(self):
+            """Re-resolve all quantities from the state on their next update"""
+            for updater in vars(self).values():
+                if isinstance(updater, AcousticDynamics._WrappedHaloUpdater):
+                    updater.invalidate()
+
     def __init__(
         self,
         comm: pace.util.CubedSphereCommunicator,
@@ -481,11 +508,21 @@ class AcousticDynamics:
         )
         # This is only here so the temporaries are attributes on this class,
         # to more easily pick them up in unit testing
-        # if self._temporaries were a dataclass we can remove this
-        for name, value in self._temporaries.items():
+        for name, value in vars(self._temporaries).items():
             setattr(self, f"_tmp_{name}", value)
         if not config.hydrostatic:
-            self._temporaries["pk3"][:] = HUGE_R
+            # the compute domain of pk3 is written by the Riemann solver before
+            # it is ever read, only the halo points need the sentinel value
+            pk3 = self._temporaries.pk3
+            isc, iec = grid_indexing.isc, grid_indexing.iec + 1
+            jsc, jec = grid_indexing.jsc, grid_indexing.jec + 1
+            pk3[:isc, :, :] = HUGE_R
+            pk3[iec:, :, :] = HUGE_R
+            pk3[isc:iec, :jsc, :] = HUGE_R
+            pk3[isc:iec, jec:, :] = HUGE_R
+        # state the temporaries were last attached to, they only need to be
+        # re-attached when a different state is passed in
+        self._temporaries_attached_to = None
 
         column_namelist = d_sw.get_column_namelist(
             config.d_grid_shallow_water,
@@ -493,39 +530,13 @@ class AcousticDynamics:
             backend=stencil_factory.backend,
         )
         if not config.hydrostatic:
-            # To write lower dimensional storages, these need to be 3D
-            # then converted to lower dimensional
-            dp_ref_3d = utils.make_storage_from_shape(
-                grid_indexing.max_shape, backend=stencil_factory.backend
-            )
-            zs_3d = utils.make_storage_from_shape(
-                grid_indexing.max_shape, backend=stencil_factory.backend
-            )
-
-            dp_ref_stencil = stencil_factory.from_origin_domain(
-                dp_ref_compute,
-                origin=grid_indexing.origin_full(),
-                domain=grid_indexing.domain_full(add=(0, 0, 1)),
-            )
-            dp_ref_stencil(
+            # dp_ref is a K-field and zs an IJ-field: compute them directly
+            # at their own dimensionality rather than through 3D buffers
+            self._dp_ref, self._zs = compute_dp_ref_zs(
                 self.grid_data.ak,
                 self.grid_data.bk,
                 phis,
-                dp_ref_3d,
-                zs_3d,
-                1.0 / constants.GRAV,
-            )
-            # After writing, make 'dp_ref' a K-field and 'zs' an IJ-field
-            self._dp_ref = utils.make_storage_data(
-                dp_ref_3d[0, 0, :],
-                (dp_ref_3d.shape[2],),
-                (0,),
-                backend=stencil_factory.backend,
-            )
-            self._zs = utils.make_storage_data(
-                zs_3d[:, :, 0],
-                zs_3d.shape[0:2],
-                (0, 0),
+                grid_indexing,
                 backend=stencil_factory.backend,
             )
             self.update_height_on_d_grid = updatedzd.UpdateHeightOnDGrid(
@@ -592,16 +603,26 @@ class AcousticDynamics:
             origin=grid_indexing.origin_compute(),
             domain=grid_indexing.domain_compute(add=(1, 1, 0)),
             externals={"hydrostatic": config.hydrostatic},
+            skip_passes=("HorizontalExecutionMerging",),
         )
 
         self.update_geopotential_height_on_c_grid = (
             updatedzc.UpdateGeopotentialHeightOnCGrid(stencil_factory, grid_data.area)
         )
 
+        # first_timestep is a compile-time choice, so the other steps do not
+        # carry a runtime branch over the whole domain
         self._zero_data = stencil_factory.from_origin_domain(
             zero_data,
             origin=grid_indexing.origin_full(),
             domain=grid_indexing.domain_full(),
+            externals={"first_timestep": False},
+        )
+        self._zero_data_first_timestep = stencil_factory.from_origin_domain(
+            zero_data,
+            origin=grid_indexing.origin_full(),
+            domain=grid_indexing.domain_full(),
+            externals={"first_timestep": True},
         )
         ax_offsets_pe = grid_indexing.axis_offsets(
             grid_indexing.origin_full(),
@@ -623,6 +644,7 @@ class AcousticDynamics:
             self._hyperdiffusion = HyperdiffusionDamping(
                 stencil_factory, damping_coefficients, grid_data.rarea, nmax=nf_ke
             )
+            self._hyperdiffusion_cd = constants.CNST_0P20 * self._da_min
         if config.rf_fast:
             self._rayleigh_damping = ray_fast.RayleighDamping(
                 stencil_factory,
@@ -650,65 +672,62 @@ class AcousticDynamics:
         )
 
     def _checkpoint_csw(self, state, tag: str):
-        if self.call_checkpointer:
-            self.checkpointer(
-                f"C_SW-{tag}",
-                delpd=state.delp,
-                ptd=state.pt,
-                ud=state.u,
-                vd=state.v,
-                wd=state.w,
-                ucd=state.uc,
-                vcd=state.vc,
-                uad=state.ua,
-                vad=state.va,
-                utd=state.ut,
-                vtd=state.vt,
-                divgdd=state.divgd,
-            )
+        self.checkpointer(
+            f"C_SW-{tag}",
+            delpd=state.delp,
+            ptd=state.pt,
+            ud=state.u,
+            vd=state.v,
+            wd=state.w,
+            ucd=state.uc,
+            vcd=state.vc,
+            uad=state.ua,
+            vad=state.va,
+            utd=state.ut,
+            vtd=state.vt,
+            divgdd=state.divgd,
+        )
 
     def _checkpoint_dsw_in(self, state):
-        if self.call_checkpointer:
-            self.checkpointer(
-                "D_SW-In",
-                ucd=state.uc,
-                vcd=state.vc,
-                wd=state.w,
-                delpcd=state.delpc,
-                delpd=state.delp,
-                ud=state.u,
-                vd=state.v,
-                ptd=state.pt,
-                uad=state.ua,
-                vad=state.va,
-                zhd=state.zh,
-                divgdd=state.divgd,
-                xfxd=state.xfx,
-                yfxd=state.yfx,
-                mfxd=state.mfxd,
-                mfyd=state.mfyd,
-            )
+        self.checkpointer(
+            "D_SW-In",
+            ucd=state.uc,
+            vcd=state.vc,
+            wd=state.w,
+            delpcd=state.delpc,
+            delpd=state.delp,
+            ud=state.u,
+            vd=state.v,
+            ptd=state.pt,
+            uad=state.ua,
+            vad=state.va,
+            zhd=state.zh,
+            divgdd=state.divgd,
+            xfxd=state.xfx,
+            yfxd=state.yfx,
+            mfxd=state.mfxd,
+            mfyd=state.mfyd,
+        )
 
     def _checkpoint_dsw_out(self, state):
-        if self.call_checkpointer:
-            self.checkpointer(
-                "D_SW-Out",
-                ucd=state.uc,
-                vcd=state.vc,
-                wd=state.w,
-                delpcd=state.delpc,
-                delpd=state.delp,
-                ud=state.u,
-                vd=state.v,
-                ptd=state.pt,
-                uad=state.ua,
-                vad=state.va,
-                divgdd=state.divgd,
-                xfxd=state.xfx,
-                yfxd=state.yfx,
-                mfxd=state.mfxd,
-                mfyd=state.mfyd,
-            )
+        self.checkpointer(
+            "D_SW-Out",
+            ucd=state.uc,
+            vcd=state.vc,
+            wd=state.w,
+            delpcd=state.delpc,
+            delpd=state.delp,
+            ud=state.u,
+            vd=state.v,
+            ptd=state.pt,
+            uad=state.ua,
+            vad=state.va,
+            divgdd=state.divgd,
+            xfxd=state.xfx,
+            yfxd=state.yfx,
+            mfxd=state.mfxd,
+            mfyd=state.mfyd,
+        )
 
     # TODO: type hint state when it is possible to do so, when it is a static type
     def __call__(
@@ -729,23 +748,36 @@ class AcousticDynamics:
         # m_split = 1. + abs(dt_atmos)/real(k_split*n_split*abs(p_split))
         # n_split = nint( real(n0split)/real(k_split*abs(p_split)) * stretch_fac + 0.5 )
         # NOTE: In Fortran model the halo update starts happens in fv_dynamics, not here
-        self._halo_updaters.q_con__cappa.start()
-        self._halo_updaters.delp__pt.start()
+        self._halo_updaters.q_con__cappa__delp__pt.start()
         self._halo_updaters.u__v.start()
-        self._halo_updaters.q_con__cappa.wait()
-
-        if update_temporaries:
-            state.__dict__.update(self._temporaries)
-
-        self._zero_data(
-            state.mfxd,
-            state.mfyd,
-            state.cxd,
-            state.cyd,
-            state.heat_source,
-            state.diss_estd,
-            n_map == 1,
-        )
+        if not self.config.hydrostatic:
+            # w is started here and at the end of each acoustic step,
+            # as soon as it is final, to overlap its exchange with more compute
+            self._halo_updaters.w.start()
+
+        if update_temporaries and state is not self._temporaries_attached_to:
+            state.__dict__.update(vars(self._temporaries))
+            self._halo_updaters.invalidate()
+            self._temporaries_attached_to = state
+
+        if n_map == 1:
+            self._zero_data_first_timestep(
+                state.mfxd,
+                state.mfyd,
+                state.cxd,
+                state.cyd,
+                state.heat_source,
+                state.diss_estd,
+            )
+        else:
+            self._zero_data(
+                state.mfxd,
+                state.mfyd,
+                state.cxd,
+                state.cyd,
+                state.heat_source,
+                state.diss_estd,
+            )
 
         # "acoustic" loop
         # called this because its timestep is usually limited by horizontal sound-wave
@@ -766,7 +798,6 @@ class AcousticDynamics:
             if self.config.breed_vortex_inline or (it == n_split - 1):
                 remap_step = True
             if not self.config.hydrostatic:
-                self._halo_updaters.w.start()
                 if it == 0:
                     self._set_gz(
                         self._zs,
@@ -775,7 +806,7 @@ class AcousticDynamics:
                     )
                     self._halo_updaters.gz.start()
             if it == 0:
-                self._halo_updaters.delp__pt.wait()
+                self._halo_updaters.q_con__cappa__delp__pt.wait()
 
             if it == n_split - 1 and end_step:
                 if self.config.use_old_omega:
@@ -790,8 +821,9 @@ class AcousticDynamics:
                 self._halo_updaters.w.wait()
 
             # compute the c-grid winds at t + 1/2 timestep
-            self._checkpoint_csw(state, tag="In")
-            self.delpc, self.ptc = self.cgrid_shallow_water_lagrangian_dynamics(
+            if self.call_checkpointer:
+                self._checkpoint_csw(state, tag="In")
+            self.cgrid_shallow_water_lagrangian_dynamics(
                 state.delp,
                 state.pt,
                 state.u,
@@ -805,9 +837,12 @@ class AcousticDynamics:
                 state.vt,
                 state.divgd,
                 state.omga,
+                self.delpc,
+                self.ptc,
                 dt2,
             )
-            self._checkpoint_csw(state, tag="Out")
+            if self.call_checkpointer:
+                self._checkpoint_csw(state, tag="Out")
 
             if self.config.nord > 0:
                 self._halo_updaters.divgd.start()
@@ -857,7 +892,8 @@ class AcousticDynamics:
             self._halo_updaters.uc__vc.wait()
             # use the computed c-grid winds to evolve the d-grid winds forward
             # by 1 timestep
-            self._checkpoint_dsw_in(state)
+            if self.call_checkpointer:
+                self._checkpoint_dsw_in(state)
             self.dgrid_shallow_water_lagrangian_dynamics(
                 state.vt,
                 state.delp,
@@ -884,11 +920,14 @@ class AcousticDynamics:
                 state.diss_estd,
                 dt,
             )
-            self._checkpoint_dsw_out(state)
+            if self.call_checkpointer:
+                self._checkpoint_dsw_out(state)
             # note that uc and vc are not needed at all past this point.
             # they will be re-computed from scratch on the next acoustic timestep.
 
-            self._halo_updaters.delp__pt__q_con.update()
+            # the height update does not read delp, pt or q_con,
+            # so their exchange is overlapped with it
+            self._halo_updaters.delp__pt__q_con.start()
 
             # Not used unless we implement other betas and alternatives to nh_p_grad
             # if self.namelist.d_ext > 0:
@@ -906,6 +945,8 @@ class AcousticDynamics:
                     ws=state.wsd,
                     dt=dt,
                 )
+            self._halo_updaters.delp__pt__q_con.wait()
+            if not self.config.hydrostatic:
                 self.riem_solver3(
                     remap_step,
                     dt,
@@ -930,12 +971,8 @@ class AcousticDynamics:
                 self._halo_updaters.pkc.start()
                 if remap_step:
                     self._edge_pe_stencil(state.pe, state.delp, self._ptop)
-                if self.config.use_logp:
-                    raise NotImplementedError(
-                        "unimplemented namelist option use_logp=True"
-                    )
-                else:
-                    self._pk3_halo(state.pk3, state.delp, self._ptop, akap)
+                # use_logp=True is rejected at construction
+                self._pk3_halo(state.pk3, state.delp, self._ptop, akap)
             if not self.config.hydrostatic:
                 self._halo_updaters.zh.wait()
                 self._compute_geopotential_stencil(
@@ -975,15 +1012,15 @@ class AcousticDynamics:
                 #        self._halo_updaters.u__v but it creates
                 #        parameter generation issues, and therefore has been duplicated
                 self._halo_updaters.u__v.start()
+                if not self.config.hydrostatic:
+                    self._halo_updaters.w.start()
             else:
                 if self.config.grid_type < 4:
                     self._halo_updaters.interface_uc__vc.interface()
 
         if self._do_del2cubed:
             self._halo_updaters.heat_source.update()
-            # TODO: move dependence on da_min into init of hyperdiffusion class
-            cd = constants.CNST_0P20 * self._da_min
-            self._hyperdiffusion(state.heat_source, cd)
+            self._hyperdiffusion(state.heat_source, self._hyperdiffusion_cd)
             if not self.config.hydrostatic:
                 delt_time_factor = abs(dt * self.config.delt_max)
                 self._compute_pkz_tempadjust(
@@ -305,7 +305,7 @@ class DynamicalCore:
             }
         )
         state.__dict__.update(self._temporaries)
-        state.__dict__.update(self.acoustic_dynamics._temporaries)
+        state.__dict__.update(vars(self.acoustic_dynamics._temporaries))
 
     def step_dynamics(self, state: DycoreState, timer: Timer):
         """
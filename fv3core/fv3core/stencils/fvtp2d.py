@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import Optional, Tuple
 
 import gt4py.gtscript as gtscript
 from gt4py.gtscript import PARALLEL, computation, horizontal, interval, region
@@ -117,6 +117,28 @@ def final_fluxes(
             )
 
 
+def make_intermediate_storages(
+    stencil_factory: StencilFactory,
+) -> Tuple[FloatField, ...]:
+    """
+    Allocate the intermediate fields of a FiniteVolumeTransport.
+
+    Every FiniteVolumeTransport writes and reads these over the same domains,
+    so a component whose transport instances are never called concurrently
+    can allocate them once and pass them to each instance.
+    """
+    idx = stencil_factory.grid_indexing
+    return tuple(
+        utils.make_storage_from_shape(
+            idx.max_shape,
+            origin=idx.origin_compute(),
+            backend=stencil_factory.backend,
+            is_temporary=False,
+        )
+        for _ in range(6)
+    )
+
+
 class FiniteVolumeTransport:
     """
     Equivalent of Fortran FV3 subroutine fv_tp_2d, done in 3 dimensions.
@@ -133,26 +155,29 @@ class FiniteVolumeTransport:
         hord,
         nord=None,
         damp_c=None,
+        intermediate_storages: Optional[Tuple[FloatField, ...]] = None,
     ):
+        """
+        Args:
+            intermediate_storages: fields from make_intermediate_storages,
+                shared with other instances of the calling component, by
+                default this instance allocates its own
+        """
         # use a shorter alias for grid_indexing here to avoid very verbose lines
         idx = stencil_factory.grid_indexing
         self._area = grid_data.area
-        origin = idx.origin_compute()
-
-        def make_storage():
-            return utils.make_storage_from_shape(
-                idx.max_shape,
-                origin=origin,
-                backend=stencil_factory.backend,
-                is_temporary=False,
-            )
-
-        self._q_advected_y = make_storage()
-        self._q_advected_x = make_storage()
-        self._q_x_advected_mean = make_storage()
-        self._q_y_advected_mean = make_storage()
-        self._q_advected_x_y_advected_mean = make_storage()
-        self._q_advected_y_x_advected_mean = make_storage()
+        (
+            self._q_advected_y,
+            self._q_advected_x,
+            self._q_x_advected_mean,
+            self._q_y_advected_mean,
+            self._q_advected_x_y_advected_mean,
+            self._q_advected_y_x_advected_mean,
+        ) = (
+            intermediate_storages
+            if intermediate_storages is not None
+            else make_intermediate_storages(stencil_factory)
+        )
         self._nord = nord
         self._damp_c = damp_c
         ord_outer = hord
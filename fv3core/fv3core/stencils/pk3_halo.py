@@ -1,7 +1,8 @@
-from gt4py.gtscript import FORWARD, computation, horizontal, interval, region
+from gt4py.gtscript import FORWARD, computation, interval
 
 import pace.dsl.gt4py_utils as utils
-from pace.dsl.stencil import StencilFactory
+from pace.dsl.dace.orchestrate import orchestrate
+from pace.dsl.stencil import StencilFactory, get_stencils_with_varied_bounds
 from pace.dsl.typing import FloatField, FloatFieldIJ
 
 
@@ -10,26 +11,12 @@ from pace.dsl.typing import FloatField, FloatFieldIJ
 def edge_pe_update(
     pe: FloatFieldIJ, delp: FloatField, pk3: FloatField, ptop: float, akap: float
 ):
-    from __externals__ import local_ie, local_is, local_je, local_js
-
     with computation(FORWARD):
         with interval(0, 1):
-            with horizontal(
-                region[local_is - 2 : local_is, local_js : local_je + 1],
-                region[local_ie + 1 : local_ie + 3, local_js : local_je + 1],
-                region[local_is - 2 : local_ie + 3, local_js - 2 : local_js],
-                region[local_is - 2 : local_ie + 3, local_je + 1 : local_je + 3],
-            ):
-                pe = ptop
+            pe = ptop
         with interval(1, None):
-            with horizontal(
-                region[local_is - 2 : local_is, local_js : local_je + 1],
-                region[local_ie + 1 : local_ie + 3, local_js : local_je + 1],
-                region[local_is - 2 : local_ie + 3, local_js - 2 : local_js],
-                region[local_is - 2 : local_ie + 3, local_je + 1 : local_je + 3],
-            ):
-                pe = pe + delp[0, 0, -1]
-                pk3 = pe ** akap
+            pe = pe + delp[0, 0, -1]
+            pk3 = pe ** akap
 
 
 class PK3Halo:
@@ -38,17 +25,26 @@ class PK3Halo:
     """
 
     def __init__(self, stencil_factory: StencilFactory):
+        orchestrate(obj=self, config=stencil_factory.config.dace_config)
         grid_indexing = stencil_factory.grid_indexing
-        origin = grid_indexing.origin_full()
-        domain = grid_indexing.domain_full(add=(0, 0, 1))
-        ax_offsets = grid_indexing.axis_offsets(origin, domain)
-        self._edge_pe_update = stencil_factory.from_origin_domain(
-            func=edge_pe_update,
-            externals={
-                **ax_offsets,
-            },
-            origin=origin,
-            domain=domain,
+        isc, iec = grid_indexing.isc, grid_indexing.iec
+        jsc, jec = grid_indexing.jsc, grid_indexing.jec
+        ni, nj = grid_indexing.domain[0], grid_indexing.domain[1]
+        nk = grid_indexing.domain[2] + 1
+        # the update only touches two halo points around the compute domain,
+        # so one stencil is run on each of the four strips instead of
+        # masking a single stencil over the full domain
+        origins = [
+            # west and east, compute domain along y
+            (isc - 2, jsc, 0),
+            (iec + 1, jsc, 0),
+            # south and north, including corners
+            (isc - 2, jsc - 2, 0),
+            (isc - 2, jec + 1, 0),
+        ]
+        domains = [(2, nj, nk), (2, nj, nk), (ni + 4, 2, nk), (ni + 4, 2, nk)]
+        self._edge_pe_update_strips = get_stencils_with_varied_bounds(
+            edge_pe_update, origins, domains, stencil_factory=stencil_factory
         )
         shape_2D = grid_indexing.domain_full(add=(1, 1, 1))[0:2]
         self._pe_tmp = utils.make_storage_from_shape(
@@ -67,4 +63,5 @@ class PK3Halo:
             ptop: The pressure level at the top of atmosphere
             akap: Poisson constant (KAPPA)
         """
-        self._edge_pe_update(self._pe_tmp, delp, pk3, ptop, akap)
+        for n in range(len(self._edge_pe_update_strips)):
+            self._edge_pe_update_strips[n](self._pe_tmp, delp, pk3, ptop, akap)
@@ -172,7 +172,7 @@ class TranslateDynCore(ParallelTranslate2PyState):
             phis=inputs["phis"],
             state=state,
         )
-        state.__dict__.update(acoustic_dynamics._temporaries)
+        state.__dict__.update(vars(acoustic_dynamics._temporaries))
         acoustic_dynamics(state, n_map=state.n_map, update_temporaries=False)
         storages_only = {}
         for name, value in vars(state).items():
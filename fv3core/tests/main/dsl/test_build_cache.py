@@ -0,0 +1,30 @@
+import os
+
+from pace.dsl.dace.build import is_build_cached, write_build_hash
+
+
+"""
+Tests the SDFG hash recorded next to orchestrated builds, which decides
+whether a build folder is re-used or recompiled.
+"""
+
+
+def test_missing_hash_is_not_cached(tmpdir):
+    assert not is_build_cached(str(tmpdir), "abc")
+
+
+def test_stale_hash_is_not_cached(tmpdir):
+    write_build_hash(str(tmpdir), "abc")
+    assert not is_build_cached(str(tmpdir), "def")
+
+
+def test_written_hash_is_cached(tmpdir):
+    write_build_hash(str(tmpdir), "abc")
+    assert is_build_cached(str(tmpdir), "abc")
+
+
+def test_write_build_hash_overwrites_and_leaves_no_temporary(tmpdir):
+    write_build_hash(str(tmpdir), "abc")
+    write_build_hash(str(tmpdir), "def")
+    assert is_build_cached(str(tmpdir), "def")
+    assert os.listdir(str(tmpdir)) == ["pace_sdfg_hash"]
@@ -0,0 +1,77 @@
+import os
+
+import dace
+import pytest
+
+from pace.dsl.dace.build import (
+    load_transformed_sdfg,
+    save_transformed_sdfg,
+    sdfg_hash_supported,
+    transformed_sdfg_key,
+)
+
+
+"""
+Tests the on-disk cache of transformed SDFGs in pace.dsl.dace.build
+"""
+
+pytestmark = pytest.mark.skipif(
+    not sdfg_hash_supported(), reason="installed DaCe cannot hash SDFGs"
+)
+
+PIPELINE = "pipeline"
+
+
+def make_sdfg() -> dace.SDFG:
+    @dace.program
+    def double(a: dace.float64[10]):
+        a[:] = 2.0 * a
+
+    return double.to_sdfg(simplify=False)
+
+
+def test_transformed_sdfg_round_trip(tmpdir):
+    sdfg = make_sdfg()
+    key = transformed_sdfg_key(sdfg, "gtc:dace", PIPELINE)
+    assert load_transformed_sdfg(str(tmpdir), key) is None
+    save_transformed_sdfg(sdfg, str(tmpdir), key)
+    loaded = load_transformed_sdfg(str(tmpdir), key)
+    assert loaded is not None
+    assert loaded.name == sdfg.name
+    assert loaded.arglist().keys() == sdfg.arglist().keys()
+    assert loaded.hash_sdfg() == sdfg.hash_sdfg()
+    assert os.listdir(str(tmpdir)) == [f"{key}.post_expand.sdfg"]
+
+
+def test_transformed_sdfg_key_is_stable():
+    assert transformed_sdfg_key(
+        make_sdfg(), "gtc:dace", PIPELINE
+    ) == transformed_sdfg_key(make_sdfg(), "gtc:dace", PIPELINE)
+
+
+def test_transformed_sdfg_key_changes_with_backend(tmpdir):
+    sdfg = make_sdfg()
+    cpu_key = transformed_sdfg_key(sdfg, "gtc:dace", PIPELINE)
+    gpu_key = transformed_sdfg_key(sdfg, "gtc:dace:gpu", PIPELINE)
+    assert cpu_key != gpu_key
+    save_transformed_sdfg(sdfg, str(tmpdir), cpu_key)
+    assert load_transformed_sdfg(str(tmpdir), gpu_key) is None
+
+
+def test_transformed_sdfg_key_changes_with_pipeline():
+    sdfg = make_sdfg()
+    assert transformed_sdfg_key(sdfg, "gtc:dace", PIPELINE) != transformed_sdfg_key(
+        sdfg, "gtc:dace", "changed pipeline"
+    )
+
+
+def test_truncated_transformed_sdfg_is_a_miss(tmpdir):
+    sdfg = make_sdfg()
+    key = transformed_sdfg_key(sdfg, "gtc:dace", PIPELINE)
+    save_transformed_sdfg(sdfg, str(tmpdir), key)
+    path = os.path.join(str(tmpdir), f"{key}.post_expand.sdfg")
+    with open(path, "r") as f:
+        content = f.read()
+    with open(path, "w") as f:
+        f.write(content[: len(content) // 2])
+    assert load_transformed_sdfg(str(tmpdir), key) is None
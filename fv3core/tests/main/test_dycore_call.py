@@ -149,6 +149,14 @@ def copy_state(state1: DycoreState, state2: DycoreState):
                     getattr(state2, attr_name).data[:] = attr.data
 
 
+def test_update_state_attaches_acoustic_temporaries():
+    dycore, state, _ = setup_dycore()
+    temporaries = vars(dycore.acoustic_dynamics._temporaries)
+    assert len(temporaries) > 0
+    for name, value in temporaries.items():
+        assert getattr(state, name) is value
+
+
 def test_temporaries_are_deterministic():
     """
     This is a precursor test to the next one, ensuring that two
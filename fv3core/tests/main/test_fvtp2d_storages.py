@@ -0,0 +1,117 @@
+import numpy as np
+
+import pace.dsl.gt4py_utils as utils
+import pace.dsl.stencil
+import pace.util
+from fv3core.stencils.fvtp2d import FiniteVolumeTransport, make_intermediate_storages
+from pace.dsl.dace.dace_config import DaceConfig, DaCeOrchestration
+from pace.util.grid import DampingCoefficients, GridData, MetricTerms
+from pace.util.null_comm import NullComm
+
+
+def setup_transport_factory():
+    backend = "numpy"
+    layout = (1, 1)
+    mpi_comm = NullComm(rank=0, total_ranks=6, fill_value=0.0)
+    partitioner = pace.util.CubedSpherePartitioner(pace.util.TilePartitioner(layout))
+    communicator = pace.util.CubedSphereCommunicator(mpi_comm, partitioner)
+    dace_config = DaceConfig(
+        communicator=communicator,
+        backend=backend,
+        orchestration=DaCeOrchestration.Python,
+    )
+    stencil_config = pace.dsl.stencil.StencilConfig(
+        backend=backend, rebuild=False, validate_args=True, dace_config=dace_config
+    )
+    sizer = pace.util.SubtileGridSizer.from_tile_params(
+        nx_tile=12,
+        ny_tile=12,
+        nz=5,
+        n_halo=3,
+        extra_dim_lengths={},
+        layout=layout,
+        tile_partitioner=partitioner.tile,
+        tile_rank=communicator.tile.rank,
+    )
+    grid_indexing = pace.dsl.stencil.GridIndexing.from_sizer_and_communicator(
+        sizer=sizer, cube=communicator
+    )
+    quantity_factory = pace.util.QuantityFactory.from_backend(
+        sizer=sizer, backend=backend
+    )
+    metric_terms = MetricTerms(
+        quantity_factory=quantity_factory,
+        communicator=communicator,
+    )
+    stencil_factory = pace.dsl.stencil.StencilFactory(
+        config=stencil_config,
+        grid_indexing=grid_indexing,
+    )
+    return (
+        stencil_factory,
+        GridData.new_from_metric_terms(metric_terms),
+        DampingCoefficients.new_from_metric_terms(metric_terms),
+    )
+
+
+def make_inputs(stencil_factory, seed):
+    random = np.random.RandomState(seed)
+    idx = stencil_factory.grid_indexing
+
+    def make_storage(low, high):
+        storage = utils.make_storage_from_shape(
+            idx.max_shape, backend=stencil_factory.backend
+        )
+        storage[:] = random.uniform(low, high, size=idx.max_shape)
+        return storage
+
+    return dict(
+        q=make_storage(0.5, 1.5),
+        crx=make_storage(-0.4, 0.4),
+        cry=make_storage(-0.4, 0.4),
+        x_area_flux=make_storage(-1.0, 1.0),
+        y_area_flux=make_storage(-1.0, 1.0),
+    )
+
+
+def run_transport(transport, stencil_factory, inputs):
+    idx = stencil_factory.grid_indexing
+    q_x_flux = utils.make_storage_from_shape(
+        idx.max_shape, backend=stencil_factory.backend
+    )
+    q_y_flux = utils.make_storage_from_shape(
+        idx.max_shape, backend=stencil_factory.backend
+    )
+    transport(**inputs, q_x_flux=q_x_flux, q_y_flux=q_y_flux)
+    return np.asarray(q_x_flux).copy(), np.asarray(q_y_flux).copy()
+
+
+def test_shared_intermediate_storages_match_separate_storages():
+    stencil_factory, grid_data, damping_coefficients = setup_transport_factory()
+
+    def make_transports(hords, intermediate_storages=None):
+        return [
+            FiniteVolumeTransport(
+                stencil_factory=stencil_factory,
+                grid_data=grid_data,
+                damping_coefficients=damping_coefficients,
+                grid_type=0,
+                hord=hord,
+                intermediate_storages=intermediate_storages,
+            )
+            for hord in hords
+        ]
+
+    hords = (6, 8)
+    shared = make_transports(
+        hords, intermediate_storages=make_intermediate_storages(stencil_factory)
+    )
+    separate = make_transports(hords)
+    # interleave calls of the instances sharing storages
+    for seed in range(4):
+        i_transport = seed % len(hords)
+        inputs = make_inputs(stencil_factory, seed)
+        shared_fluxes = run_transport(shared[i_transport], stencil_factory, inputs)
+        separate_fluxes = run_transport(separate[i_transport], stencil_factory, inputs)
+        for shared_flux, separate_flux in zip(shared_fluxes, separate_fluxes):
+            np.testing.assert_array_equal(shared_flux, separate_flux)
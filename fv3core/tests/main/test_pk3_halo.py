@@ -0,0 +1,80 @@
+import numpy as np
+from gt4py.gtscript import FORWARD, computation, horizontal, interval, region
+
+import pace.dsl.gt4py_utils as utils
+from fv3core.stencils.pk3_halo import PK3Halo
+from pace.dsl.dace.dace_config import DaceConfig
+from pace.dsl.stencil import GridIndexing, StencilConfig, StencilFactory
+from pace.dsl.typing import FloatField, FloatFieldIJ
+
+
+def edge_pe_update_regions(
+    pe: FloatFieldIJ, delp: FloatField, pk3: FloatField, ptop: float, akap: float
+):
+    """pk3 halo update as it was written over the full domain with regions"""
+    from __externals__ import local_ie, local_is, local_je, local_js
+
+    with computation(FORWARD):
+        with interval(0, 1):
+            with horizontal(
+                region[local_is - 2 : local_is, local_js : local_je + 1],
+                region[local_ie + 1 : local_ie + 3, local_js : local_je + 1],
+                region[local_is - 2 : local_ie + 3, local_js - 2 : local_js],
+                region[local_is - 2 : local_ie + 3, local_je + 1 : local_je + 3],
+            ):
+                pe = ptop
+        with interval(1, None):
+            with horizontal(
+                region[local_is - 2 : local_is, local_js : local_je + 1],
+                region[local_ie + 1 : local_ie + 3, local_js : local_je + 1],
+                region[local_is - 2 : local_ie + 3, local_js - 2 : local_js],
+                region[local_is - 2 : local_ie + 3, local_je + 1 : local_je + 3],
+            ):
+                pe = pe + delp[0, 0, -1]
+                pk3 = pe ** akap
+
+
+def test_pk3_halo_strips_match_regions():
+    backend = "numpy"
+    config = StencilConfig(backend=backend, dace_config=DaceConfig(None, backend))
+    grid_indexing = GridIndexing(
+        domain=(6, 7, 5),
+        n_halo=3,
+        south_edge=True,
+        north_edge=True,
+        west_edge=True,
+        east_edge=True,
+    )
+    stencil_factory = StencilFactory(config=config, grid_indexing=grid_indexing)
+    random = np.random.RandomState(0)
+    shape = grid_indexing.max_shape
+    delp = utils.make_storage_data(
+        random.uniform(100.0, 1000.0, size=shape), shape, backend=backend
+    )
+    pk3_init = random.uniform(size=shape)
+    ptop = 300.0
+    akap = 0.286
+
+    pk3 = utils.make_storage_data(pk3_init.copy(), shape, backend=backend)
+    PK3Halo(stencil_factory)(pk3, delp, ptop, akap)
+
+    origin = grid_indexing.origin_full()
+    domain = grid_indexing.domain_full(add=(0, 0, 1))
+    baseline_stencil = stencil_factory.from_origin_domain(
+        func=edge_pe_update_regions,
+        externals=grid_indexing.axis_offsets(origin, domain),
+        origin=origin,
+        domain=domain,
+    )
+    pk3_baseline = utils.make_storage_data(pk3_init.copy(), shape, backend=backend)
+    pe_baseline = utils.make_storage_from_shape(
+        grid_indexing.domain_full(add=(1, 1, 1))[0:2], origin, backend=backend
+    )
+    baseline_stencil(pe_baseline, delp, pk3_baseline, ptop, akap)
+
+    np.testing.assert_array_equal(np.asarray(pk3), np.asarray(pk3_baseline))
+    # the update must reach the corner columns of the south and north strips
+    isc, jsc = grid_indexing.isc, grid_indexing.jsc
+    assert np.all(
+        np.asarray(pk3)[isc - 2, jsc - 2, 1:6] != pk3_init[isc - 2, jsc - 2, 1:6]
+    )
@@ -1,4 +1,5 @@
 import pace.dsl
+import pace.dsl.gt4py_utils as utils
 import pace.util
 from fv3core.stencils.c_sw import CGridShallowWaterDynamics
 from fv3core.testing import TranslateDycoreFortranData2Py
@@ -105,7 +106,13 @@ class TranslateC_SW(TranslateDycoreFortranData2Py):
 
     def compute(self, inputs):
         self.make_storage_data_input_vars(inputs)
-        delpc, ptc = self.compute_func(**inputs)
+        delpc = utils.make_storage_from_shape(
+            self.maxshape, backend=self.stencil_factory.backend
+        )
+        ptc = utils.make_storage_from_shape(
+            self.maxshape, backend=self.stencil_factory.backend
+        )
+        self.compute_func(**inputs, delpc=delpc, ptc=ptc)
         return self.slice_output(inputs, {"delpcd": delpc, "ptcd": ptc})
 
 
@@ -1,6 +1,6 @@
 import logging
 from datetime import datetime, timedelta
-from typing import List, Tuple, Union
+from typing import List, Optional, Tuple, Union
 
 import cftime
 
@@ -44,6 +44,8 @@ class ZarrMonitor:
         partitioner: CubedSpherePartitioner,
         mode: str = "w",
         mpi_comm=DummyComm(),
+        z_chunk_size: Optional[int] = None,
+        dtype: Optional[str] = None,
     ):
         """Create a ZarrMonitor.
 
@@ -54,6 +56,15 @@ class ZarrMonitor:
             mpi_comm: mpi4py comm object to use for communications. By default, will
                 use a dummy comm object that works in single-core mode.
             time_chunk_size: the chunk size of the time dimension
+            z_chunk_size: the chunk size of vertical dimensions, by default
+                the whole column is stored in one chunk. Use 1 if data will
+                mostly be read one level at a time.
+            dtype: data type used to store (non-constant) quantities, by default
+                the data type of each quantity. A lower precision type such as
+                "float16" reduces output size when full precision is not needed,
+                e.g. for visualization. Values outside the range of the type
+                are stored as inf, float16 cannot hold magnitudes above 65504
+                so it is unsuitable for quantities such as pressures in Pa.
         """
         if mpi_comm.Get_rank() == 0:
             group = zarr.open_group(store, mode=mode)
@@ -63,6 +74,8 @@ class ZarrMonitor:
         self._comm = mpi_comm
         self._writers = None
         self._constants: List[str] = []
+        self._z_chunk_size = z_chunk_size
+        self._dtype = dtype
         self.partitioner = partitioner
 
     def _init_writers(self, state):
@@ -72,6 +85,8 @@ class ZarrMonitor:
                 self._group,
                 name=key,
                 partitioner=self.partitioner,
+                z_chunk_size=self._z_chunk_size,
+                dtype=self._dtype,
             )
             for key in set(state.keys()).difference(["time"])
         }
@@ -113,8 +128,20 @@ class ZarrMonitor:
         [time].
         """
         self._ensure_writers_are_consistent(state)
-        for name, quantity in sorted(state.items(), key=lambda x: x[0]):
-            self._writers[name].append(quantity)  # type: ignore[index]
+        writers = self._writers
+        prepared = [
+            (writers[name], writers[name].prepare_append(quantity))  # type: ignore
+            for name, quantity in sorted(state.items(), key=lambda x: x[0])
+        ]
+        # arrays are only resized on the root rank, share all of their new
+        # metadata in one collective rather than one broadcast per variable
+        arrays = self._comm.bcast(
+            {writer.name: writer.array for writer, _ in prepared}, root=0
+        )
+        for writer, quantity in prepared:
+            writer.array = arrays[writer.name]
+            writer.write_append(quantity)
+        self._comm.barrier()
 
     def store_constant(self, grid: dict) -> None:
         for name, quantity in grid.items():
@@ -127,13 +154,26 @@ class ZarrMonitor:
                 self._group,
                 name=name,
                 partitioner=self.partitioner,
+                z_chunk_size=self._z_chunk_size,
             )
             constant_writer.append(quantity)  # type: ignore[index]
             self._constants.append(name)
 
+    def consolidate_metadata(self) -> None:
+        """Consolidate the metadata of all stored arrays into a single key.
+
+        This allows readers to open the store with consolidated=True, which
+        reads one metadata document instead of one per array. Should be called
+        once all data has been stored, as metadata of arrays extended after
+        consolidation will be stale.
+        """
+        if self._comm.Get_rank() == 0:
+            zarr.consolidate_metadata(self._group.store)
+        self._comm.barrier()
+
 
 class _ZarrVariableWriter:
-    def __init__(self, comm, group, name, partitioner):
+    def __init__(self, comm, group, name, partitioner, z_chunk_size=None, dtype=None):
         self.i_time = 0
         self.comm = comm
         self.group = group
@@ -146,6 +186,8 @@ class _ZarrVariableWriter:
         self._x_chunks = partitioner.tile.layout[1]
         self._PREPEND_DIMS = ("time", "tile")
         self._partitioner = partitioner
+        self._z_chunk_size = z_chunk_size
+        self._dtype = dtype
 
     @property
     def partitioner(self):
@@ -170,12 +212,15 @@ class _ZarrVariableWriter:
     def _init_zarr_root(self, quantity):
         tile_shape = self._partitioner.tile.global_extent(quantity.metadata)
         chunks = self._prepend_chunks + array_chunks(
-            self._partitioner.layout, tile_shape, quantity.dims
+            self._partitioner.layout,
+            tile_shape,
+            quantity.dims,
+            z_chunk_size=self._z_chunk_size,
         )
         self.array = self.group.create_dataset(
             self.name,
             shape=self._prepend_shape + tile_shape,
-            dtype=quantity.data.dtype,
+            dtype=self._dtype or quantity.data.dtype,
             chunks=chunks,
             fill_value=None,
         )
@@ -206,6 +251,17 @@ class _ZarrVariableWriter:
             )
 
     def append(self, quantity):
+        quantity = self.prepare_append(quantity)
+        self.sync_array()
+        self.write_append(quantity)
+
+    def prepare_append(self, quantity):
+        """Initialize and extend the array to fit the next timestep.
+
+        The array is only extended on the root rank, sync_array must be called
+        before write_append. Returns the quantity in the dimension order of
+        the stored array.
+        """
         # can't just use zarr_array.append because we only want to
         # extend the dimension once, from the root rank
         if self.array is None:
@@ -221,8 +277,10 @@ class _ZarrVariableWriter:
             )
             new_shape[0] = self.i_time + 1
             self.array.resize(*new_shape)
-        self.sync_array()
+        return quantity
 
+    def write_append(self, quantity):
+        """Write this rank's data for the next timestep into the array."""
         target_slice = (
             self.i_time,
             self._partitioner.tile_index(self.rank),
@@ -278,11 +336,14 @@ def array_chunks(
     layout: Tuple[int, int],
     tile_array_shape: Tuple[int, ...],
     array_dims: Tuple[str, ...],
+    z_chunk_size: Optional[int] = None,
 ):
     layout_by_dims = utils.list_by_dims(array_dims, layout, 1)
     chunks_list = []
     for extent, dim, n_ranks in zip(tile_array_shape, array_dims, layout_by_dims):
-        if dim in constants.INTERFACE_DIMS:
+        if z_chunk_size is not None and dim in constants.Z_DIMS:
+            chunks_list.append(min(z_chunk_size, extent))
+        elif dim in constants.INTERFACE_DIMS:
             chunks_list.append(int((extent - 1) // n_ranks))
         else:
             chunks_list.append(int(extent // n_ranks))
@@ -378,18 +439,24 @@ class _ZarrTimeWriter(_ZarrVariableWriter):
         )
 
     def append(self, time):
-        array = xr.DataArray()
+        time = self.prepare_append(time)
+        self.sync_array()
+        self.write_append(time)
+        self.comm.barrier()
+
+    def prepare_append(self, time):
         if self.array is None:
-            self._init_zarr(array)
+            self._init_zarr(xr.DataArray())
             self._set_time_encoding_attrs(time)
         if self.i_time >= self.array.shape[0] and self.rank == 0:
             new_shape = (self.i_time + 1,)
             self.array.resize(*new_shape)
-        self.sync_array()
+        return time
+
+    def write_append(self, time):
         if self.rank == 0:
             self.array[self.i_time] = self._encode_time(time)
         self.i_time += 1
-        self.comm.barrier()
 
 
 def get_calendar(time: Union[datetime, timedelta, cftime.datetime]):
@@ -17,6 +17,7 @@ except ModuleNotFoundError:
     xr = None
 import copy
 import logging
+import unittest.mock
 
 import pace.util
 from pace.util import X_DIMS, Y_DIMS
@@ -262,6 +263,56 @@ def test_monitor_file_store_multi_rank_state(
     numpy.testing.assert_array_equal(group["var1"], 1.0)
 
 
+@requires_zarr
+def test_monitor_store_broadcasts_once_per_step(tmpdir_factory, numpy):
+    layout = (1, 1)
+    total_ranks = 6 * layout[0] * layout[1]
+    partitioner = pace.util.CubedSpherePartitioner(pace.util.TilePartitioner(layout))
+    store = zarr.storage.DirectoryStore(tmpdir_factory.mktemp("data.zarr"))
+    time = cftime.DatetimeJulian(2010, 6, 20, 6, 0, 0)
+    timestep = timedelta(hours=1)
+    shared_buffer = {}
+    comms = []
+    monitors = []
+    for rank in range(total_ranks):
+        comm = DummyComm(rank=rank, total_ranks=total_ranks, buffer_dict=shared_buffer)
+        comm.bcast = unittest.mock.MagicMock(wraps=comm.bcast)
+        comms.append(comm)
+        monitors.append(pace.util.ZarrMonitor(store, partitioner, mpi_comm=comm))
+
+    def make_state(rank, i_t):
+        return {
+            "time": time + i_t * timestep,
+            "a": pace.util.Quantity(
+                numpy.full([4, 4], rank + 10.0 * i_t), dims=("y", "x"), units="m"
+            ),
+            "b": pace.util.Quantity(
+                numpy.full([3, 4, 4], rank + 10.0 * i_t + 100.0),
+                dims=("z", "y", "x"),
+                units="K",
+            ),
+        }
+
+    nt = 3
+    for i_t in range(nt):
+        for rank in range(total_ranks):
+            n_bcast = comms[rank].bcast.call_count
+            monitors[rank].store(make_state(rank, i_t))
+            if i_t > 0:
+                # arrays are created on the first step, after which all
+                # variables share one broadcast per step
+                assert comms[rank].bcast.call_count == n_bcast + 1
+    group = zarr.open_group(store, mode="r")
+    assert group["a"].shape == (nt, total_ranks, 4, 4)
+    assert group["b"].shape == (nt, total_ranks, 3, 4, 4)
+    for i_t in range(nt):
+        for rank in range(total_ranks):
+            numpy.testing.assert_array_equal(group["a"][i_t, rank], rank + 10.0 * i_t)
+            numpy.testing.assert_array_equal(
+                group["b"][i_t, rank], rank + 10.0 * i_t + 100.0
+            )
+
+
 @pytest.mark.parametrize(
     "layout, tile_array_shape, array_dims, target",
     [
@@ -324,6 +375,49 @@ def test_array_chunks(layout, tile_array_shape, array_dims, target):
     assert result == target
 
 
+@pytest.mark.parametrize(
+    "z_chunk_size, array_dims, target",
+    [
+        pytest.param(
+            1,
+            [pace.util.Z_DIM, pace.util.Y_DIM, pace.util.X_DIM],
+            (1, 3, 3),
+            id="single_level",
+        ),
+        pytest.param(
+            1,
+            [pace.util.Y_DIM, pace.util.Z_INTERFACE_DIM, pace.util.X_DIM],
+            (3, 1, 3),
+            id="single_level_interface",
+        ),
+        pytest.param(
+            16,
+            [pace.util.Z_DIM, pace.util.Y_DIM, pace.util.X_DIM],
+            (7, 3, 3),
+            id="larger_than_column",
+        ),
+    ],
+)
+@requires_zarr
+def test_array_chunks_z_chunk_size(z_chunk_size, array_dims, target):
+    result = pace.util.zarr_monitor.array_chunks(
+        (2, 2), (7, 6, 6), array_dims, z_chunk_size=z_chunk_size
+    )
+    assert result == target
+
+
+@requires_zarr
+def test_monitor_z_chunk_size(cube_partitioner, numpy):
+    store = {}
+    monitor = pace.util.ZarrMonitor(store, cube_partitioner, z_chunk_size=1)
+    quantity = pace.util.Quantity(
+        numpy.random.uniform(size=(5, 4, 4)), dims=("z", "y", "x"), units="m"
+    )
+    monitor.store({"var": quantity})
+    group = zarr.open_group(store, mode="r")
+    assert group["var"].chunks == (1, 1, 1, 4, 4)
+
+
 def _assert_no_nulls(dataset: "xr.Dataset"):
     number_of_null = dataset["var"].isnull().sum().item()
     total_size = dataset["var"].size
@@ -375,6 +469,41 @@ def test_values_preserved(cube_partitioner, numpy):
     assert dataset["var"].dims[2:] == dims
 
 
+@requires_zarr
+def test_consolidated_metadata(cube_partitioner, numpy):
+    store = {}
+    monitor = pace.util.ZarrMonitor(store, cube_partitioner)
+    quantity = pace.util.Quantity(
+        numpy.random.uniform(size=(10, 10)), dims=("y", "x"), units="m"
+    )
+    monitor.store({"time": datetime(2010, 1, 1), "var": quantity})
+    monitor.store({"time": datetime(2010, 1, 1, 1), "var": quantity})
+    monitor.consolidate_metadata()
+
+    dataset = xr.open_zarr(store, consolidated=True, chunks=None)
+    assert dataset["var"].shape[:2] == (2, 6)
+    numpy.testing.assert_array_almost_equal(
+        dataset["var"][1, 0, :, :].values, quantity.data
+    )
+
+
+@requires_zarr
+def test_monitor_dtype(cube_partitioner, numpy):
+    store = {}
+    monitor = pace.util.ZarrMonitor(store, cube_partitioner, dtype="float16")
+    quantity = pace.util.Quantity(
+        numpy.random.uniform(size=(10, 10)), dims=("y", "x"), units="m"
+    )
+    monitor.store({"var": quantity})
+    monitor.store_constant({"const": quantity})
+    group = zarr.open_group(store, mode="r")
+    assert group["var"].dtype == numpy.float16
+    assert group["const"].dtype == quantity.data.dtype
+    numpy.testing.assert_allclose(
+        group["var"][0, 0, :, :], quantity.data, rtol=1e-3, atol=1e-3
+    )
+
+
 @pytest.fixture
 def state_list_with_inconsistent_calendars(base_state, numpy):
     state_list = []